@@ -0,0 +1,81 @@
+"""
+Persistent key -> JSON value cache using SQLite
+"""
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+class JsonCache:
+    """
+    Small on-disk cache of JSON-serializable values, stamped with the time
+    they were stored. Used to skip work repeated across runs (re-scraping a
+    job, re-parsing an unchanged input file).
+    """
+
+    def __init__(self, db_path: Union[str, Path], table: str = "cache"):
+        """
+        Initialize cache, creating the database file and table if needed.
+
+        Args:
+            db_path: Path to SQLite database file
+            table: Table name, so several caches can share one file
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the cache's lifetime (autocommit mode)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                saved_at REAL NOT NULL,
+                value TEXT NOT NULL
+            )
+        """)
+        self._sql_get = f"SELECT saved_at, value FROM {table} WHERE key = ?"
+        self._sql_set = f"INSERT OR REPLACE INTO {table} (key, saved_at, value) VALUES (?, ?, ?)"
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+            max_age: Ignore entries older than this many seconds (default: no limit)
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        row = self._conn.execute(self._sql_get, (key,)).fetchone()
+        if row is None:
+            return None
+
+        saved_at, value = row
+        if max_age is not None and time.time() - saved_at > max_age:
+            return None
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value, replacing any previous entry for the key.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        self._conn.execute(self._sql_set, (key, time.time(), json.dumps(value, ensure_ascii=False)))
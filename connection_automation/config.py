@@ -1,10 +1,10 @@
 """
 Configuration settings for LinkedIn connection automation
 """
-import os
+from pathlib import Path
 
-# Base directory
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Base directory (resolved once at import)
+BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Rate Limits (CONSERVATIVE DEFAULTS)
 DAILY_LIMIT = 20          # Max connection requests per day
@@ -24,13 +24,29 @@ SEND_WITH_NOTE = False            # Do NOT add personalized messages
 DEFAULT_MESSAGE = ""              # No message template
 
 # Tracking & Logging
-DATA_DIR = os.path.join(BASE_DIR, "data")
-INPUT_DIR = os.path.join(DATA_DIR, "input")
-OUTPUT_DIR = os.path.join(DATA_DIR, "output")
+# Paths are pathlib.Path objects; sqlite3.connect() and open() accept them
+DATA_DIR = BASE_DIR / "data"
+INPUT_DIR = DATA_DIR / "input"
+OUTPUT_DIR = DATA_DIR / "output"
 
-TRACKING_DB = os.path.join(OUTPUT_DIR, "connections.db")
-LOG_FILE = os.path.join(OUTPUT_DIR, "connection_log.json")
-CSV_OUTPUT = os.path.join(OUTPUT_DIR, "connections_sent.csv")
+TRACKING_DB = OUTPUT_DIR / "connections.db"
+LOG_FILE = OUTPUT_DIR / "connection_log.jsonl"    # One JSON event per line
+CSV_OUTPUT = OUTPUT_DIR / "connections_sent.csv"
+CACHE_DB = OUTPUT_DIR / "cache.db"                # Prepared input files, scraped jobs, dry-run results
+DRY_RUN_RESULT_MAX_AGE = 24 * 3600                # Trust dry-run profile states for 1 day
+
+# Chrome profile kept between runs so the LinkedIn session survives and
+# the login step can be skipped (one browser at a time can use it)
+CHROME_PROFILE_DIR = Path.home() / ".linkedin_scraper_chrome"
+
+# Chrome flags for running without a window
+HEADLESS_ARGUMENTS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",  # Desktop layout, so the same selectors match
+]
 
 # LinkedIn URLs
 LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
@@ -40,6 +56,14 @@ LINKEDIN_PROFILE_BASE = "https://www.linkedin.com/in/"
 PAGE_LOAD_TIMEOUT = 10           # Seconds to wait for page load
 ELEMENT_WAIT_TIMEOUT = 5         # Seconds to wait for elements
 
+# Assets blocked via Chrome DevTools on profile pages (not needed to click Connect)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif",
+    "*.woff", "*.woff2",
+    "*.mp4", "*.webm",
+    "*google-analytics*", "*doubleclick*", "*linkedin.com/li/track*",
+]
+
 # Retry Settings (disabled per user request)
 ENABLE_RETRY = False             # Do not retry failed connections
 MAX_RETRIES = 0                  # No retries
@@ -6,10 +6,138 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from typing import Tuple, Optional
+from linkedin_scraper.actions import block_urls
+from linkedin_scraper.constants import MINIMAL_ASSETS_PREFS
 from . import config
-from .utils import random_sleep
+
+try:
+    # In requirements.txt; lets kill_driver() find the Chrome processes.
+    # Without it, kill_driver() falls back to the slow driver.quit()
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# Locators are built once at import time and shared by every call
+PROFILE_MAIN_LOCATOR = (By.CSS_SELECTOR, "main.scaffold-layout__main")
+# LinkedIn labels the Connect button "Invite <name> to connect"
+CONNECT_LOCATOR = (
+    By.CSS_SELECTOR,
+    'button[aria-label*="Invite"], button.pvs-profile-actions__action[aria-label*="connect" i]'
+)
+ALREADY_CONNECTED_LOCATOR = (By.XPATH, '//button[.//span[text()="Message"]] | //span[contains(text(), "Pending")]')
+PENDING_LOCATOR = (By.XPATH, '//button[.//span[text()="Pending"]]')
+SEND_LOCATOR = (By.XPATH, '//button[contains(@aria-label, "Send")]')
+MORE_LOCATOR = (By.XPATH, '//button[.//span[text()="More"]]')
+MENU_CONNECT_LOCATOR = (By.XPATH, '//div[@role="menu"]//span[text()="Connect"]')
+DISMISS_LOCATOR = (By.XPATH, '//button[contains(@aria-label, "Dismiss")]')
+MODAL_LOCATOR = (By.CSS_SELECTOR, 'div[role="dialog"]')
+
+# Visible action buttons on the profile as [{a: aria-label, t: text}, ...]
+ACTION_BUTTONS_SCRIPT = """
+return [...document.querySelectorAll('main button')]
+    .filter(b => b.offsetParent)
+    .map(b => ({a: b.getAttribute('aria-label'), t: b.innerText.trim().slice(0, 20)}));
+"""
+
+# Profile states returned by ConnectionSender.get_profile_state()
+STATE_ALREADY_CONNECTED = "already_connected"
+STATE_PENDING = "pending"
+STATE_CONNECT = "connect"
+STATE_MORE = "more"
+STATE_UNKNOWN = "unknown"
+
+
+def build_driver(
+    user_data_dir: Optional[str] = None,
+    headless: bool = False,
+    block_images: bool = False
+) -> webdriver.Chrome:
+    """
+    Create a Chrome driver tuned for LinkedIn automation.
+
+    Uses the "eager" page load strategy so driver.get() returns at
+    DOMContentLoaded instead of waiting for every image and tracker;
+    ConnectionSender's explicit waits handle the rest.
+
+    Args:
+        user_data_dir: Persistent Chrome profile directory (e.g.
+            config.CHROME_PROFILE_DIR). Keeps the LinkedIn session between
+            runs; Chrome locks it, so only one driver can use it at a time.
+        headless: Run Chrome without a window (see config.HEADLESS_ARGUMENTS)
+        block_images: Never load images, e.g. for job scraping, which only
+            reads text
+
+    Returns:
+        Configured Chrome WebDriver instance (logged in only if the
+        profile kept a session)
+    """
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = "eager"
+    if block_images:
+        options.add_experimental_option("prefs", MINIMAL_ASSETS_PREFS)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    if headless:
+        for argument in config.HEADLESS_ARGUMENTS:
+            options.add_argument(argument)
+
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+def kill_driver(driver: webdriver.Chrome):
+    """
+    Stop a driver at once by killing ChromeDriver and every Chrome process
+    it started, instead of waiting seconds for driver.quit()'s graceful
+    shutdown. Chrome has to go too: a leftover browser keeps the
+    --user-data-dir profile locked, so the next run could not start.
+    Without psutil the browser processes cannot be found, so this falls
+    back to driver.quit().
+    """
+    if psutil is None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return
+
+    try:
+        service = psutil.Process(driver.service.process.pid)
+        # Collected before killing anything: orphans are re-parented
+        processes = service.children(recursive=True) + [service]
+    except (AttributeError, psutil.Error):
+        return
+
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+
+
+class FastDriver:
+    """
+    Context manager around a driver: quits it normally on a clean exit,
+    and kills it with kill_driver() when leaving on an exception such as
+    Ctrl+C, so the shell is freed immediately.
+    """
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+
+    def __enter__(self) -> webdriver.Chrome:
+        return self.driver
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.driver.quit()
+        else:
+            kill_driver(self.driver)
 
 
 class ConnectionSender:
@@ -22,9 +150,31 @@ class ConnectionSender:
         Initialize connection sender with Selenium driver.
 
         Args:
-            driver: Selenium WebDriver instance (must be logged in)
+            driver: Selenium WebDriver instance (must be logged in).
+                Use build_driver() to get one with the eager page load
+                strategy; with the default "normal" strategy every
+                navigation also waits for images and analytics to finish.
         """
         self.driver = driver
+        # State of the current profile from the last action-button snapshot
+        self._profile_state = None
+        self._configure_cdp()
+
+    def _configure_cdp(self):
+        """
+        Block images, fonts, media and analytics beacons via Chrome DevTools.
+        Profile pages only need their HTML/JSON to find the Connect button.
+        Drivers without CDP support print a warning and load pages unblocked.
+        """
+        block_urls(self.driver, config.BLOCKED_URL_PATTERNS)
+
+    def _js_click(self, element):
+        """
+        Click an element by dispatching the DOM click directly.
+        Skips WebDriver's visibility check and scroll-into-view round-trips;
+        callers still wait on the resulting DOM change.
+        """
+        self.driver.execute_script("arguments[0].click();", element)
 
     def navigate_to_profile(self, profile_url: str) -> bool:
         """
@@ -36,15 +186,61 @@ class ConnectionSender:
         Returns:
             True if navigation successful, False otherwise
         """
+        self._profile_state = None
         try:
             self.driver.get(profile_url)
-            # Wait for page to load
-            random_sleep(config.MIN_DELAY_BETWEEN_ACTIONS, config.MAX_DELAY_BETWEEN_ACTIONS)
-            return True
+            # Wait for the profile layout to render instead of sleeping blindly
+            WebDriverWait(self.driver, config.PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located(PROFILE_MAIN_LOCATOR)
+            )
         except Exception as e:
             print(f"      ❌ Navigation failed: {e}")
             return False
 
+        # The action buttons render after the layout shell; wait until the
+        # snapshot recognizes them. A timeout is not an error: the callers
+        # still classify the profile (STATE_UNKNOWN) and fall back as before
+        try:
+            WebDriverWait(self.driver, config.ELEMENT_WAIT_TIMEOUT).until(
+                lambda d: self.get_profile_state() not in (None, STATE_UNKNOWN)
+            )
+        except TimeoutException:
+            pass
+        return True
+
+    def get_profile_state(self) -> Optional[str]:
+        """
+        Classify the current profile from one snapshot of its visible
+        action buttons, instead of probing each selector separately.
+        The result is remembered so find_connect_button() can skip
+        lookups that cannot succeed.
+
+        Returns:
+            One of STATE_PENDING, STATE_ALREADY_CONNECTED, STATE_CONNECT,
+            STATE_MORE, STATE_UNKNOWN, or None if the snapshot could not
+            be taken
+        """
+        try:
+            buttons = self.driver.execute_script(ACTION_BUTTONS_SCRIPT) or []
+        except WebDriverException:
+            return None
+
+        labels = [((b.get('a') or '').lower(), b.get('t') or '') for b in buttons]
+
+        if any(text == 'Pending' or 'pending' in label for label, text in labels):
+            state = STATE_PENDING
+        elif any(text == 'Message' for label, text in labels):
+            state = STATE_ALREADY_CONNECTED
+        elif any('invite' in label or text == 'Connect' for label, text in labels):
+            state = STATE_CONNECT
+        elif any(text == 'More' or label.startswith('more actions') for label, text in labels):
+            state = STATE_MORE
+        else:
+            state = STATE_UNKNOWN
+
+        self._profile_state = state
+        return state
+
     def is_already_connected(self) -> bool:
         """
         Check if already connected or request is pending.
@@ -52,67 +248,51 @@ class ConnectionSender:
         Returns:
             True if already connected/pending, False if can connect
         """
-        # Indicators that we're already connected or request is pending
-        indicators = [
-            "//button[.//span[text()='Message']]",      # Already connected
-            "//button[.//span[text()='Pending']]",      # Request pending
-            "//span[contains(text(), 'Pending')]",       # Pending text
-        ]
-
-        for selector in indicators:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                if elements:
-                    return True
-            except:
-                continue
+        state = self.get_profile_state()
+        if state is not None:
+            return state in (STATE_ALREADY_CONNECTED, STATE_PENDING)
 
-        return False
+        # Snapshot failed: Message button (connected) or Pending text (request pending)
+        try:
+            return bool(self.driver.find_elements(*ALREADY_CONNECTED_LOCATOR))
+        except:
+            return False
 
     def find_connect_button(self) -> Optional[webdriver.remote.webelement.WebElement]:
         """
         Find the Connect button on the profile page.
-        Tries multiple selector strategies as LinkedIn's HTML varies.
+        Matches the button's aria-label variants with a single CSS query,
+        falling back to the "More" dropdown when none is displayed.
 
         Returns:
             WebElement if found, None otherwise
         """
-        # Strategy 1: Try direct Connect button
-        direct_selectors = [
-            '//button[.//span[contains(@class, "artdeco-button__text") and text()="Connect"]]',
-            '//button[.//span[text()="Connect"]]',
-            '//button[contains(@aria-label, "Invite")]',
-        ]
-
-        for selector in direct_selectors:
-            try:
-                button = self.driver.find_element(By.XPATH, selector)
-                if button and button.is_displayed():
+        # Strategy 1: Try direct Connect button (skipped when the snapshot
+        # already showed Connect is only reachable through "More")
+        if self._profile_state != STATE_MORE:
+            for button in self.driver.find_elements(*CONNECT_LOCATOR):
+                if button.is_displayed():
                     return button
-            except NoSuchElementException:
-                continue
 
         # Strategy 2: Check if Connect is hidden in "More" dropdown
         try:
             # Click More button
-            more_button = self.driver.find_element(By.XPATH, '//button[.//span[text()="More"]]')
+            more_button = self.driver.find_element(*MORE_LOCATOR)
             if more_button:
-                more_button.click()
-                random_sleep(1, 2)
+                self._js_click(more_button)
 
-                # Find Connect in dropdown
-                connect_in_dropdown = self.driver.find_element(
-                    By.XPATH,
-                    '//div[@role="menu"]//span[text()="Connect"]'
+                # Wait for Connect to appear in the dropdown
+                connect_in_dropdown = WebDriverWait(self.driver, config.ELEMENT_WAIT_TIMEOUT).until(
+                    EC.presence_of_element_located(MENU_CONNECT_LOCATOR)
                 )
                 if connect_in_dropdown:
                     return connect_in_dropdown.find_element(By.XPATH, '..')  # Get parent button
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException):
             pass
 
         return None
 
-    def send_connection_request(self, add_note: bool = False, message: str = "") -> Tuple[bool, str]:
+    def send_connection_request(self, add_note: bool = False, message: str = "") -> Tuple[bool, str, bool]:
         """
         Send a connection request.
 
@@ -121,49 +301,53 @@ class ConnectionSender:
             message: Message to send (not used per user request)
 
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (success: bool, message: str, pending_observed: bool).
+            pending_observed is True when the Pending state was already
+            seen after sending, so no separate verification is needed.
         """
         try:
             # Find and click Connect button
             connect_button = self.find_connect_button()
 
             if not connect_button:
-                return False, "Connect button not found"
+                return False, "Connect button not found", False
 
             # Click the Connect button
-            connect_button.click()
-            random_sleep(2, 3)
+            self._js_click(connect_button)
 
             # Wait for modal to appear
             try:
                 # Look for Send button in modal
                 send_button = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, '//button[contains(@aria-label, "Send")]'))
+                    EC.element_to_be_clickable(SEND_LOCATOR)
                 )
 
                 # Note: We're NOT adding a note per user request (SEND_WITH_NOTE = False)
                 # Just click Send directly
 
-                send_button.click()
-                random_sleep(1, 2)
+                self._js_click(send_button)
+                self._wait_for_modal_to_close()
+
+                # One snapshot tells us whether the Pending pill is already shown
+                pending_observed = self.get_profile_state() == STATE_PENDING
 
-                return True, "Connection request sent successfully"
+                return True, "Connection request sent successfully", pending_observed
 
             except TimeoutException:
                 # Modal didn't appear - might have been sent directly
                 # Check if we can find a success indicator
                 try:
                     # Sometimes "Pending" appears immediately
-                    pending = self.driver.find_element(By.XPATH, '//button[.//span[text()="Pending"]]')
+                    pending = self.driver.find_element(*PENDING_LOCATOR)
                     if pending:
-                        return True, "Connection request sent (no modal)"
+                        return True, "Connection request sent (no modal)", True
                 except:
                     pass
 
-                return False, "Modal timeout - unclear if request sent"
+                return False, "Modal timeout - unclear if request sent", False
 
         except Exception as e:
-            return False, f"Error sending request: {str(e)}"
+            return False, f"Error sending request: {str(e)}", False
 
     def close_modal_if_open(self):
         """
@@ -172,27 +356,41 @@ class ConnectionSender:
         """
         try:
             # Look for modal close button
-            close_button = self.driver.find_element(
-                By.XPATH,
-                '//button[contains(@aria-label, "Dismiss")]'
-            )
+            close_button = self.driver.find_element(*DISMISS_LOCATOR)
             if close_button:
-                close_button.click()
-                random_sleep(1, 2)
+                self._js_click(close_button)
+                self._wait_for_modal_to_close()
         except:
             pass
 
-    def verify_connection_sent(self) -> bool:
+    def _wait_for_modal_to_close(self):
+        """
+        Wait until the modal dialog is gone from the page.
+        Returns early as soon as it disappears; a timeout is not an error.
+        """
+        try:
+            WebDriverWait(self.driver, config.ELEMENT_WAIT_TIMEOUT).until(
+                EC.invisibility_of_element_located(MODAL_LOCATOR)
+            )
+        except TimeoutException:
+            pass
+
+    def verify_connection_sent(self, timeout: float = 2) -> bool:
         """
         Verify that connection request was sent by checking for "Pending" button.
 
+        Args:
+            timeout: Seconds to wait for the Pending button to appear
+
         Returns:
             True if Pending button found, False otherwise
         """
         try:
-            pending_button = self.driver.find_element(By.XPATH, '//button[.//span[text()="Pending"]]')
+            pending_button = WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(PENDING_LOCATOR)
+            )
             return pending_button is not None
-        except NoSuchElementException:
+        except TimeoutException:
             return False
 
     def send_connection_with_verification(self) -> Tuple[bool, str]:
@@ -203,13 +401,16 @@ class ConnectionSender:
             Tuple of (success: bool, message: str)
         """
         # Send the request
-        success, message = self.send_connection_request()
+        success, message, pending_observed = self.send_connection_request()
 
         if not success:
             return success, message
 
+        # Pending already seen while sending - no need to probe again
+        if pending_observed:
+            return True, "Connection request sent and verified"
+
         # Verify it was sent
-        random_sleep(1, 2)
         if self.verify_connection_sent():
             return True, "Connection request sent and verified"
         else:
@@ -3,8 +3,27 @@ Data loader for scraped job data (JSON/CSV)
 """
 import json
 import csv
-from typing import List, Dict, Optional
-from .utils import validate_profile_url, normalize_profile_url, extract_profile_id
+import os
+from typing import List, Dict, Optional, Tuple
+from .cache import JsonCache
+from .utils import validate_profile_url, normalize_profile_url, normalize_profile_urls_batch, extract_profile_id
+
+try:
+    import orjson  # Optional: much faster parsing of large job dumps
+except ImportError:
+    orjson = None
+
+
+# Job fields used downstream (filtering, summaries, tracking, export)
+NEEDED_COLUMNS = (
+    'poster_profile_url',
+    'poster_profile_id',
+    'poster_name',
+    'poster_headline',
+    'job_title',
+    'company',
+    'location',
+)
 
 
 def load_jobs_from_json(filepath: str) -> List[Dict]:
@@ -21,8 +40,11 @@ def load_jobs_from_json(filepath: str) -> List[Dict]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        jobs = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    jobs = orjson.loads(data) if orjson else json.loads(data)
 
     if not isinstance(jobs, list):
         raise ValueError("JSON file must contain a list of jobs")
@@ -30,10 +52,36 @@ def load_jobs_from_json(filepath: str) -> List[Dict]:
     return jobs
 
 
+def load_jobs_from_jsonl(filepath: str) -> List[Dict]:
+    """
+    Load scraped job data from a JSON Lines file (one job object per line),
+    as streamed by scrape_search_results.py.
+
+    Args:
+        filepath: Path to JSONL file
+
+    Returns:
+        List of job dictionaries
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If a line is not valid JSON
+    """
+    loads = orjson.loads if orjson else json.loads
+
+    with open(filepath, 'rb') as f:
+        # Skip blank lines, e.g. a trailing newline
+        return [loads(line) for line in f if line.strip()]
+
+
 def load_jobs_from_csv(filepath: str) -> List[Dict]:
     """
     Load scraped job data from CSV file.
 
+    Only the columns listed in NEEDED_COLUMNS are kept; the header is
+    resolved to column indices once instead of building a full dict
+    per row.
+
     Args:
         filepath: Path to CSV file
 
@@ -43,14 +91,20 @@ def load_jobs_from_csv(filepath: str) -> List[Dict]:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    jobs = []
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            jobs.append(dict(row))
+        if not header:
+            return []
 
-    return jobs
+        columns = [(name, header.index(name)) for name in NEEDED_COLUMNS if name in header]
+
+        return [
+            {name: row[i] if i < len(row) else None for name, i in columns}
+            for row in reader
+            if row  # Skip blank lines, as DictReader does
+        ]
 
 
 def filter_jobs_with_posters(jobs: List[Dict]) -> List[Dict]:
@@ -107,41 +161,98 @@ def deduplicate_profiles(jobs: List[Dict]) -> List[Dict]:
     return unique_jobs
 
 
-def load_and_prepare_data(filepath: str) -> List[Dict]:
+def filter_and_dedupe(jobs: List[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Filter jobs with valid poster profile URLs and remove duplicate
+    posters in a single pass.
+
+    Equivalent to deduplicate_profiles(filter_jobs_with_posters(jobs))
+    without building the intermediate filtered list.
+
+    Args:
+        jobs: List of job dictionaries
+
+    Returns:
+        Tuple of (jobs with unique poster profiles, number of jobs with
+        a valid poster URL before deduplication)
+    """
+    seen_profile_ids = set()
+    unique_jobs = []
+    with_posters = 0
+
+    # Validate and normalize every poster URL up front (None = invalid)
+    normalized_urls = normalize_profile_urls_batch([job.get('poster_profile_url') for job in jobs])
+
+    for job, normalized_url in zip(jobs, normalized_urls):
+        if normalized_url is None:
+            continue
+
+        with_posters += 1
+
+        profile_id = extract_profile_id(normalized_url)
+
+        if profile_id and profile_id not in seen_profile_ids:
+            seen_profile_ids.add(profile_id)
+            # Update job with normalized URL
+            job['poster_profile_url'] = normalized_url
+            job['poster_profile_id'] = profile_id
+            unique_jobs.append(job)
+
+    return unique_jobs, with_posters
+
+
+def load_and_prepare_data(filepath: str, cache: Optional[JsonCache] = None) -> Dict[str, Dict]:
     """
     Load job data, filter for posters, and deduplicate.
 
     This is the main function to use for loading data.
 
     Args:
-        filepath: Path to JSON or CSV file
+        filepath: Path to JSON, JSONL or CSV file
+        cache: Optional cache of prepared results, keyed by the file's
+            path, size and modification time; an unchanged file is not
+            parsed again
 
     Returns:
-        List of unique job posters ready for connection requests
+        Unique job posters ready for connection requests, keyed by
+        poster_profile_id in file order. Every entry has a validated
+        poster_profile_url and poster_profile_id.
 
     Raises:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is unsupported
     """
+    if cache is not None:
+        stat = os.stat(filepath)
+        cache_key = f"by_id:{os.path.abspath(filepath)}:{stat.st_size}:{stat.st_mtime_ns}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print(f"✓ Loaded {len(cached)} unique poster profiles from cache")
+            return cached
+
     # Determine file type
     if filepath.endswith('.json'):
         jobs = load_jobs_from_json(filepath)
+    elif filepath.endswith('.jsonl'):
+        jobs = load_jobs_from_jsonl(filepath)
     elif filepath.endswith('.csv'):
         jobs = load_jobs_from_csv(filepath)
     else:
-        raise ValueError("File must be .json or .csv format")
+        raise ValueError("File must be .json, .jsonl or .csv format")
 
     print(f"✓ Loaded {len(jobs)} jobs from {filepath}")
 
-    # Filter for jobs with poster info
-    jobs_with_posters = filter_jobs_with_posters(jobs)
-    print(f"✓ Found {len(jobs_with_posters)} jobs with poster profiles")
-
-    # Deduplicate by profile
-    unique_profiles = deduplicate_profiles(jobs_with_posters)
+    # Filter for jobs with poster info and deduplicate by profile
+    unique_profiles, with_posters = filter_and_dedupe(jobs)
+    print(f"✓ Found {with_posters} jobs with poster profiles")
     print(f"✓ Identified {len(unique_profiles)} unique poster profiles")
 
-    return unique_profiles
+    profiles_by_id = {profile['poster_profile_id']: profile for profile in unique_profiles}
+
+    if cache is not None:
+        cache.set(cache_key, profiles_by_id)
+
+    return profiles_by_id
 
 
 def get_profile_summary(job: Dict) -> str:
@@ -169,30 +280,22 @@ def export_profiles_summary(jobs: List[Dict], output_file: str):
         jobs: List of job dictionaries
         output_file: Path to output CSV file
     """
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'poster_profile_id',
-            'poster_profile_url',
-            'poster_name',
-            'poster_headline',
-            'job_title',
-            'company',
-            'location'
-        ]
+    fieldnames = [
+        'poster_profile_id',
+        'poster_profile_url',
+        'poster_name',
+        'poster_headline',
+        'job_title',
+        'company',
+        'location'
+    ]
 
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for job in jobs:
-            row = {
-                'poster_profile_id': job.get('poster_profile_id', ''),
-                'poster_profile_url': job.get('poster_profile_url', ''),
-                'poster_name': job.get('poster_name', ''),
-                'poster_headline': job.get('poster_headline', ''),
-                'job_title': job.get('job_title', ''),
-                'company': job.get('company', ''),
-                'location': job.get('location', '')
-            }
-            writer.writerow(row)
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            [job.get(field, '') for field in fieldnames]
+            for job in jobs
+        )
 
     print(f"✓ Exported profile summary to {output_file}")
@@ -0,0 +1,196 @@
+"""
+Parallel connection sending across several Selenium sessions
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Tuple
+from selenium import webdriver
+from . import config
+from .connection_sender import ConnectionSender
+from .data_loader import get_profile_summary
+from .safety_manager import SafetyManager
+from .tracker import ConnectionTracker
+from .utils import random_sleep
+
+
+class ConnectionOrchestrator:
+    """
+    Send connection requests from a pool of browser sessions.
+
+    Each worker thread owns its own driver and ConnectionSender; the
+    tracker and safety manager are shared. Per-worker delays still apply,
+    so this shortens the wall-clock of large campaigns without changing
+    the pacing of any single session. Quotas are enforced across all
+    workers together.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], webdriver.Chrome],
+        tracker: ConnectionTracker,
+        safety_manager: SafetyManager,
+        max_workers: int = 2
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            driver_factory: Callable returning a new, logged-in driver.
+                Called once per worker thread.
+            tracker: Shared connection tracker
+            safety_manager: Shared safety manager
+            max_workers: Number of concurrent browser sessions
+        """
+        self.driver_factory = driver_factory
+        self.tracker = tracker
+        self.safety_manager = safety_manager
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._drivers = []
+        self._in_flight = 0
+        self._stop_reason = None
+        self._results = {}
+
+    def _get_sender(self) -> ConnectionSender:
+        """
+        Get this worker thread's ConnectionSender, starting its driver on first use.
+        """
+        sender = getattr(self._local, 'sender', None)
+        if sender is None:
+            driver = self.driver_factory()
+            with self._lock:
+                self._drivers.append(driver)
+            sender = ConnectionSender(driver)
+            self._local.sender = sender
+        return sender
+
+    def _reserve_slot(self) -> Tuple[bool, str]:
+        """
+        Reserve quota for one request, counting requests still in flight
+        on other workers so the pool cannot overshoot the limits.
+
+        Returns:
+            Tuple of (reserved: bool, reason: str)
+        """
+        with self._lock:
+            if self._stop_reason:
+                return False, self._stop_reason
+
+            status = self.safety_manager.get_quota_status()
+            remaining = min(status['daily_remaining'], status['weekly_remaining']) - self._in_flight
+
+            if remaining <= 0:
+                self._stop_reason = self.safety_manager.can_send_request()[1]
+                if self._stop_reason == "OK":
+                    self._stop_reason = "Quota reserved by in-flight requests"
+                return False, self._stop_reason
+
+            self._in_flight += 1
+            return True, "OK"
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _record(self, key: str):
+        with self._lock:
+            self._results[key] = self._results.get(key, 0) + 1
+
+    def _process_profile(self, profile: Dict):
+        """
+        Navigate to one profile and send a connection request.
+        Runs on a worker thread.
+        """
+        profile_id = profile.get('poster_profile_id')
+        profile_url = profile.get('poster_profile_url')
+        poster_name = profile.get('poster_name', 'Unknown')
+        job_title = profile.get('job_title', 'Unknown')
+        company = profile.get('company', 'Unknown')
+        summary = get_profile_summary(profile)
+
+        reserved, reason = self._reserve_slot()
+        if not reserved:
+            self._record('skipped')
+            return
+
+        send_attempted = False
+        try:
+            sender = self._get_sender()
+
+            if not sender.navigate_to_profile(profile_url):
+                print(f"   ❌ {summary}: Failed to navigate")
+                self.tracker.mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, "Navigation failed")
+                self._record('failed')
+                return
+
+            if sender.is_already_connected():
+                print(f"   ⚠️  {summary}: Already connected or pending")
+                self.tracker.mark_as_sent(profile_id, profile_url, 'already_connected', poster_name, job_title, company)
+                self._record('already_connected')
+                return
+
+            send_attempted = True
+            success, message = sender.send_connection_with_verification()
+
+            if success:
+                print(f"   ✅ {summary}: {message}")
+                self.tracker.mark_as_sent(profile_id, profile_url, 'success', poster_name, job_title, company)
+                self._record('success')
+            else:
+                print(f"   ❌ {summary}: {message}")
+                self.tracker.mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, message)
+                self._record('failed')
+
+        except Exception as e:
+            print(f"   ❌ {summary}: {e}")
+            self._record('failed')
+        finally:
+            self._release_slot()
+
+            # Per-worker pacing, also after early returns: the request delay
+            # after a send attempt, the action delay after a profile visit only
+            if send_attempted:
+                random_sleep(config.MIN_DELAY_BETWEEN_REQUESTS, config.MAX_DELAY_BETWEEN_REQUESTS)
+            else:
+                random_sleep(config.MIN_DELAY_BETWEEN_ACTIONS, config.MAX_DELAY_BETWEEN_ACTIONS)
+
+    def run(self, profiles: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Send connection requests to all profiles using the worker pool.
+        Stops dispatching once the daily or weekly quota is reached.
+
+        Args:
+            profiles: Prepared profiles, e.g. the values of
+                data_loader.load_and_prepare_data()
+
+        Returns:
+            Dictionary of counts: success, already_connected, failed, skipped
+        """
+        self._results = {'success': 0, 'already_connected': 0, 'failed': 0, 'skipped': 0}
+        self._stop_reason = None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._process_profile, profiles))
+        finally:
+            self.close()
+
+        if self._stop_reason:
+            print(f"   ⚠️  {self._stop_reason}")
+
+        return dict(self._results)
+
+    def close(self):
+        """
+        Quit every driver started by the worker threads.
+        """
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -3,10 +3,33 @@ Safety manager for enforcing rate limits and quotas
 """
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Optional, Tuple
 from . import config
 
 
+# Quota SQL kept as constants so sqlite3's statement cache reuses them
+SQL_COUNT_SINCE = """
+    SELECT COUNT(*) FROM connections
+    WHERE sent_at >= ?
+    AND status = 'success'
+"""
+SQL_COUNT_TODAY_AND_WEEK = """
+    SELECT
+        COUNT(CASE WHEN sent_at >= ? THEN 1 END),
+        COUNT(*)
+    FROM connections
+    WHERE sent_at >= ?
+    AND status = 'success'
+"""
+SQL_OLDEST_THIS_WEEK = """
+    SELECT sent_at FROM connections
+    WHERE sent_at >= ?
+    AND status = 'success'
+    ORDER BY sent_at ASC
+    LIMIT 1
+"""
+
+
 class SafetyManager:
     """
     Enforce daily and weekly connection request quotas.
@@ -25,6 +48,43 @@ class SafetyManager:
         self.db_path = db_path or config.TRACKING_DB
         self.daily_limit = daily_limit or config.DAILY_LIMIT
         self.weekly_limit = weekly_limit or config.WEEKLY_LIMIT
+        # One connection for the manager's lifetime (autocommit mode)
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _window_bounds(now: datetime) -> Tuple[str, str]:
+        """
+        Get the start of today and the time 7 days ago as ISO strings.
+
+        sent_at is stored in the same "YYYY-MM-DD HH:MM:SS.ffffff" form,
+        so SQLite compares plain strings on the indexed column.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Tuple of (today_start, week_ago)
+        """
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_ago = now - timedelta(days=7)
+        return today_start.isoformat(sep=' '), week_ago.isoformat(sep=' ')
 
     def get_requests_today(self) -> int:
         """
@@ -33,20 +93,13 @@ class SafetyManager:
         Returns:
             Number of requests sent today
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
-        # Get today's date at midnight
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_start, _ = self._window_bounds(datetime.now())
 
-        cursor.execute("""
-            SELECT COUNT(*) FROM connections
-            WHERE sent_at >= ?
-            AND status = 'success'
-        """, (today_start,))
+        cursor.execute(SQL_COUNT_SINCE, (today_start,))
 
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count
 
@@ -57,23 +110,34 @@ class SafetyManager:
         Returns:
             Number of requests sent this week
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
-        # Get timestamp 7 days ago
-        week_ago = datetime.now() - timedelta(days=7)
+        _, week_ago = self._window_bounds(datetime.now())
 
-        cursor.execute("""
-            SELECT COUNT(*) FROM connections
-            WHERE sent_at >= ?
-            AND status = 'success'
-        """, (week_ago,))
+        cursor.execute(SQL_COUNT_SINCE, (week_ago,))
 
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count
 
+    def _get_counts(self) -> Tuple[int, int]:
+        """
+        Count successful requests sent today and in the last 7 days
+        with a single query.
+
+        Returns:
+            Tuple of (requests_today, requests_this_week)
+        """
+        cursor = self._conn.cursor()
+
+        today_start, week_ago = self._window_bounds(datetime.now())
+
+        cursor.execute(SQL_COUNT_TODAY_AND_WEEK, (today_start, week_ago))
+
+        requests_today, requests_this_week = cursor.fetchone()
+
+        return requests_today, requests_this_week
+
     def can_send_request(self) -> Tuple[bool, str]:
         """
         Check if a connection request can be sent without exceeding quotas.
@@ -82,8 +146,7 @@ class SafetyManager:
             Tuple of (can_send: bool, reason: str)
             If can_send is False, reason explains why
         """
-        requests_today = self.get_requests_today()
-        requests_this_week = self.get_requests_this_week()
+        requests_today, requests_this_week = self._get_counts()
 
         if requests_today >= self.daily_limit:
             return False, f"Daily limit reached ({requests_today}/{self.daily_limit})"
@@ -100,8 +163,7 @@ class SafetyManager:
         Returns:
             Dictionary with daily/weekly usage and remaining quota
         """
-        requests_today = self.get_requests_today()
-        requests_this_week = self.get_requests_this_week()
+        requests_today, requests_this_week = self._get_counts()
 
         return {
             'daily_used': requests_today,
@@ -140,25 +202,33 @@ class SafetyManager:
         # This is a placeholder - actual registration happens in tracker
         pass
 
-    def get_daily_reset_time(self) -> datetime:
+    def get_daily_reset_time(self, now: Optional[datetime] = None) -> datetime:
         """
         Get the time when daily quota resets (midnight tonight).
 
+        Args:
+            now: Reference time (default: current time)
+
         Returns:
             Datetime of next daily reset
         """
-        tomorrow = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        now = now or datetime.now()
+        tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
         return tomorrow
 
-    def get_hours_until_daily_reset(self) -> float:
+    def get_hours_until_daily_reset(self, now: Optional[datetime] = None) -> float:
         """
         Get hours remaining until daily quota resets.
 
+        Args:
+            now: Reference time (default: current time)
+
         Returns:
             Hours until midnight (daily reset)
         """
-        reset_time = self.get_daily_reset_time()
-        delta = reset_time - datetime.now()
+        now = now or datetime.now()
+        reset_time = self.get_daily_reset_time(now)
+        delta = reset_time - now
         return delta.total_seconds() / 3600
 
     def suggest_next_run_time(self) -> str:
@@ -179,24 +249,18 @@ class SafetyManager:
 
         if status['weekly_used'] >= self.weekly_limit:
             # Calculate when week resets (7 days from oldest request in past week)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._conn.cursor()
 
-            cursor.execute("""
-                SELECT sent_at FROM connections
-                WHERE sent_at >= datetime('now', '-7 days')
-                AND status = 'success'
-                ORDER BY sent_at ASC
-                LIMIT 1
-            """)
+            now = datetime.now()
+            _, week_ago = self._window_bounds(now)
+            cursor.execute(SQL_OLDEST_THIS_WEEK, (week_ago,))
 
             row = cursor.fetchone()
-            conn.close()
 
             if row:
                 oldest_request = datetime.fromisoformat(row[0])
                 reset_time = oldest_request + timedelta(days=7)
-                hours_until_reset = (reset_time - datetime.now()).total_seconds() / 3600
+                hours_until_reset = (reset_time - now).total_seconds() / 3600
 
                 return f"Weekly limit reached. Try again in {hours_until_reset:.1f} hours."
 
@@ -3,17 +3,49 @@ Connection tracker using SQLite database
 """
 import sqlite3
 import csv
+import threading
 from datetime import datetime
-from typing import Optional, List, Dict
+from pathlib import Path
+from typing import Optional, List, Dict, Set, Tuple, Union
 from . import config
 
 
+# Hot-path SQL kept as constants so sqlite3's statement cache reuses them
+SQL_INSERT_CONN = """
+    INSERT INTO connections (
+        profile_id, profile_url, poster_name, job_title,
+        company, sent_at, status, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Batch variant skips duplicate profile_ids instead of aborting the batch
+SQL_INSERT_CONN_IGNORE = SQL_INSERT_CONN.replace("INSERT INTO", "INSERT OR IGNORE INTO")
+SQL_CHECK_PROFILE = "SELECT COUNT(*) FROM connections WHERE profile_id = ?"
+SQL_SELECT_PROFILE_IDS = "SELECT profile_id FROM connections"
+SQL_SELECT_ALL = "SELECT * FROM connections ORDER BY sent_at DESC"
+SQL_SELECT_BY_STATUS = "SELECT * FROM connections WHERE status = ? ORDER BY sent_at DESC"
+SQL_COUNT_ALL = "SELECT COUNT(*) FROM connections"
+SQL_COUNT_BY_STATUS = "SELECT status, COUNT(*) as count FROM connections GROUP BY status"
+
+# Column order for CSV export (also the SELECT order in SQL_EXPORT)
+EXPORT_FIELDNAMES = [
+    'profile_id',
+    'profile_url',
+    'poster_name',
+    'job_title',
+    'company',
+    'sent_at',
+    'status',
+    'error_message'
+]
+SQL_EXPORT = f"SELECT {', '.join(EXPORT_FIELDNAMES)} FROM connections ORDER BY sent_at DESC"
+
+
 class ConnectionTracker:
     """
     Track sent connection requests to prevent duplicates and enable resume capability.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
         """
         Initialize tracker with database connection.
 
@@ -21,14 +53,38 @@ class ConnectionTracker:
             db_path: Path to SQLite database file (default: from config)
         """
         self.db_path = db_path or config.TRACKING_DB
+        # One connection for the tracker's lifetime (autocommit mode)
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        # Serializes writes when the tracker is shared between worker threads
+        self._lock = threading.Lock()
         self._init_database()
 
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _init_database(self):
         """
         Create database tables if they don't exist.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+
+        # WAL avoids an fsync of the main database file on every commit
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS connections (
@@ -44,8 +100,12 @@ class ConnectionTracker:
             )
         """)
 
-        conn.commit()
-        conn.close()
+        # Quota checks filter on status + sent_at range; profile_id is
+        # already indexed by its UNIQUE constraint
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_connections_status_sent
+            ON connections(status, sent_at)
+        """)
 
     def already_contacted(self, profile_id: str) -> bool:
         """
@@ -57,19 +117,30 @@ class ConnectionTracker:
         Returns:
             True if already contacted, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
-        cursor.execute("""
-            SELECT COUNT(*) FROM connections
-            WHERE profile_id = ?
-        """, (profile_id,))
+        cursor.execute(SQL_CHECK_PROFILE, (profile_id,))
 
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count > 0
 
+    def load_contacted_ids(self) -> Set[str]:
+        """
+        Load the IDs of all contacted profiles in one query.
+
+        Use this instead of already_contacted() when filtering many
+        profiles, so membership checks are set lookups rather than
+        one query per profile.
+
+        Returns:
+            Set of LinkedIn profile IDs
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_SELECT_PROFILE_IDS)
+
+        return {row[0] for row in cursor}
+
     def mark_as_sent(
         self,
         profile_id: str,
@@ -92,32 +163,42 @@ class ConnectionTracker:
             company: Company name
             error_message: Error message if failed
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
-                INSERT INTO connections (
-                    profile_id, profile_url, poster_name, job_title,
-                    company, sent_at, status, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                profile_id,
-                profile_url,
-                poster_name,
-                job_title,
-                company,
-                datetime.now(),
-                status,
-                error_message
-            ))
-
-            conn.commit()
+            with self._lock, self._conn:
+                self._conn.execute(SQL_INSERT_CONN, (
+                    profile_id,
+                    profile_url,
+                    poster_name,
+                    job_title,
+                    company,
+                    datetime.now(),
+                    status,
+                    error_message
+                ))
         except sqlite3.IntegrityError:
             # Already exists (duplicate profile_id)
             pass
-        finally:
-            conn.close()
+
+    def mark_many_as_sent(self, records: List[Tuple]) -> int:
+        """
+        Record many connection requests in a single transaction.
+
+        Intended for backfills and imports, where one commit for the
+        whole batch replaces one commit per row. Records whose
+        profile_id already exists are skipped, as in mark_as_sent().
+
+        Args:
+            records: Tuples of (profile_id, profile_url, poster_name,
+                job_title, company, sent_at, status, error_message)
+
+        Returns:
+            Number of rows inserted
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.executemany(SQL_INSERT_CONN_IGNORE, records)
+
+        return cursor.rowcount
 
     def get_all_sent_connections(self) -> List[Dict]:
         """
@@ -126,19 +207,14 @@ class ConnectionTracker:
         Returns:
             List of connection dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-        cursor.execute("""
-            SELECT * FROM connections
-            ORDER BY sent_at DESC
-        """)
+        cursor.execute(SQL_SELECT_ALL)
 
         rows = cursor.fetchall()
         connections = [dict(row) for row in rows]
 
-        conn.close()
         return connections
 
     def get_connections_by_status(self, status: str) -> List[Dict]:
@@ -151,20 +227,14 @@ class ConnectionTracker:
         Returns:
             List of connection dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-        cursor.execute("""
-            SELECT * FROM connections
-            WHERE status = ?
-            ORDER BY sent_at DESC
-        """, (status,))
+        cursor.execute(SQL_SELECT_BY_STATUS, (status,))
 
         rows = cursor.fetchall()
         connections = [dict(row) for row in rows]
 
-        conn.close()
         return connections
 
     def get_statistics(self) -> Dict:
@@ -174,23 +244,16 @@ class ConnectionTracker:
         Returns:
             Dictionary with counts and percentages
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         # Total connections
-        cursor.execute("SELECT COUNT(*) FROM connections")
+        cursor.execute(SQL_COUNT_ALL)
         total = cursor.fetchone()[0]
 
         # By status
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM connections
-            GROUP BY status
-        """)
+        cursor.execute(SQL_COUNT_BY_STATUS)
         status_counts = dict(cursor.fetchall())
 
-        conn.close()
-
         return {
             'total': total,
             'success': status_counts.get('success', 0),
@@ -199,58 +262,39 @@ class ConnectionTracker:
             'by_status': status_counts
         }
 
-    def export_to_csv(self, output_file: str):
+    def export_to_csv(self, output_file: Union[str, Path]):
         """
         Export all connections to CSV file.
 
+        Rows are streamed straight from the database cursor to the
+        writer, so the full history is never held in memory.
+
         Args:
             output_file: Path to output CSV file
         """
-        connections = self.get_all_sent_connections()
+        total = self._conn.execute(SQL_COUNT_ALL).fetchone()[0]
 
-        if not connections:
+        if not total:
             print("⚠️  No connections to export")
             return
 
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_EXPORT)
+
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'profile_id',
-                'profile_url',
-                'poster_name',
-                'job_title',
-                'company',
-                'sent_at',
-                'status',
-                'error_message'
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for conn in connections:
-                writer.writerow({
-                    'profile_id': conn['profile_id'],
-                    'profile_url': conn['profile_url'],
-                    'poster_name': conn['poster_name'] or '',
-                    'job_title': conn['job_title'] or '',
-                    'company': conn['company'] or '',
-                    'sent_at': conn['sent_at'],
-                    'status': conn['status'],
-                    'error_message': conn['error_message'] or ''
-                })
-
-        print(f"✓ Exported {len(connections)} connections to {output_file}")
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDNAMES)
+            # csv.writer writes None as an empty string
+            writer.writerows(cursor)
+
+        print(f"✓ Exported {total} connections to {output_file}")
 
     def clear_all(self):
         """
         Clear all connections from database.
         USE WITH CAUTION - This deletes all history.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM connections")
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM connections")
 
         print("⚠️  Cleared all connection history")
@@ -1,11 +1,26 @@
 """
 Utility functions for connection automation
 """
+import asyncio
 import time
 import random
 import os
+import re
+import sys
+import json
+from functools import lru_cache
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+# Profile ID is the path segment after /in/ (stops at /, ? or #)
+PROFILE_ID_RE = re.compile(r'linkedin\.com/in/([^/?#]+)')
+VALID_PROFILE_URL_RE = re.compile(r'^https?://([a-z0-9-]+\.)*linkedin\.com/in/', re.IGNORECASE)
+
 
 def random_sleep(min_sec, max_sec):
     """
@@ -16,6 +31,40 @@ def random_sleep(min_sec, max_sec):
     time.sleep(duration)
 
 
+async def random_asleep(min_sec, max_sec):
+    """
+    Async version of random_sleep for use inside asyncio code.
+    Yields to the event loop instead of blocking the thread.
+    """
+    duration = random.uniform(min_sec, max_sec)
+    await asyncio.sleep(duration)
+
+
+def random_deadline(min_sec, max_sec, start=None):
+    """
+    Return a time.monotonic() deadline a random min_sec-max_sec seconds
+    after start (default: now). Pair with sleep_until() so work done in
+    the meantime counts toward the delay instead of adding to it.
+    """
+    if start is None:
+        start = time.monotonic()
+    return start + random.uniform(min_sec, max_sec)
+
+
+def sleep_until(deadline):
+    """
+    Sleep until time.monotonic() reaches deadline.
+    Returns immediately if the deadline has already passed.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+# The URL helpers below are pure functions called repeatedly with the same
+# scraped URLs, so each public function guards its input and delegates to
+# an lru_cache'd implementation; empty/None inputs return before the cache.
+
 def normalize_profile_url(url):
     """
     Normalize LinkedIn profile URL by removing query parameters
@@ -28,8 +77,14 @@ def normalize_profile_url(url):
     if not url:
         return None
 
-    # Remove query parameters
-    clean_url = url.split('?')[0]
+    return _normalize_profile_url(url)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_profile_url(url):
+    # Remove query parameters (slice instead of split: no throwaway list)
+    query_start = url.find('?')
+    clean_url = url if query_start < 0 else url[:query_start]
 
     # Ensure trailing slash
     if not clean_url.endswith('/'):
@@ -49,15 +104,13 @@ def extract_profile_id(url):
     if not url:
         return None
 
-    # Remove trailing slash and split
-    url = url.rstrip('/')
-    parts = url.split('/')
+    return _extract_profile_id(url)
 
-    # Profile ID is the last part
-    if 'linkedin.com/in/' in url:
-        return parts[-1]
 
-    return None
+@lru_cache(maxsize=8192)
+def _extract_profile_id(url):
+    match = PROFILE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def format_timestamp(dt=None):
@@ -67,7 +120,8 @@ def format_timestamp(dt=None):
     """
     if dt is None:
         dt = datetime.now()
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Same "YYYY-MM-DD HH:MM:SS" output as strftime, without format parsing
+    return dt.isoformat(sep=' ', timespec='seconds')
 
 
 def ensure_directory_exists(dirpath):
@@ -77,6 +131,39 @@ def ensure_directory_exists(dirpath):
     os.makedirs(dirpath, exist_ok=True)
 
 
+def append_log_event(log_file, event):
+    """
+    Append one event to a newline-delimited JSON (NDJSON) log.
+
+    Each call writes a single line, so logging cost stays constant
+    no matter how long the session runs.
+
+    Args:
+        log_file: Path to the .jsonl log file
+        event: JSON-serializable dictionary
+    """
+    if orjson:
+        line = orjson.dumps(event, default=str)
+    else:
+        line = json.dumps(event, ensure_ascii=False, default=str).encode('utf-8')
+
+    with open(log_file, 'ab') as f:
+        f.write(line + b'\n')
+
+
+def read_log(log_file):
+    """
+    Stream events from an NDJSON log written by append_log_event().
+
+    Yields:
+        One event dictionary per non-empty line
+    """
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 def truncate_text(text, max_length=50):
     """
     Truncate text to max_length characters and add ellipsis if needed.
@@ -90,6 +177,23 @@ def truncate_text(text, max_length=50):
     return text[:max_length-3] + "..."
 
 
+def truncate_text_bytes(data, max_length=50):
+    """
+    Truncate already-encoded bytes (e.g. ASCII log fields) to max_length
+    bytes and add an ellipsis if needed. Same rules as truncate_text.
+
+    The cut is by byte, so only use this on ASCII data; a multi-byte
+    UTF-8 character at the boundary would be split.
+    """
+    if not data:
+        return b""
+
+    if len(data) <= max_length:
+        return data
+
+    return data[:max_length-3] + b"..."
+
+
 def validate_profile_url(url):
     """
     Check if URL is a valid LinkedIn profile URL.
@@ -99,15 +203,28 @@ def validate_profile_url(url):
     if not url or not isinstance(url, str):
         return False
 
-    # Must contain linkedin.com/in/
-    if 'linkedin.com/in/' not in url.lower():
-        return False
+    return _validate_profile_url(url)
 
-    # Must start with http or https
-    if not url.startswith('http'):
-        return False
 
-    return True
+@lru_cache(maxsize=8192)
+def _validate_profile_url(url):
+    # http(s) URL on linkedin.com (any subdomain) with an /in/ path
+    return VALID_PROFILE_URL_RE.match(url) is not None
+
+
+def normalize_profile_urls_batch(urls):
+    """
+    Validate and normalize a list of profile URLs in one call.
+
+    Returns a list aligned with the input: the normalized URL for each
+    valid profile URL, None for anything else.
+    """
+    normalize = _normalize_profile_url
+    validate = _validate_profile_url
+    return [
+        normalize(url) if url and isinstance(url, str) and validate(url) else None
+        for url in urls
+    ]
 
 
 def print_progress_bar(current, total, prefix='', length=50):
@@ -120,14 +237,20 @@ def print_progress_bar(current, total, prefix='', length=50):
         prefix: Text to show before progress bar
         length: Length of progress bar in characters
     """
+    # Redraw at 1% granularity only; each redraw is a write + flush
+    if current != total and current % max(1, total // 100):
+        return
+
     percent = 100 * (current / float(total))
     filled_length = int(length * current // total)
     bar = '█' * filled_length + '-' * (length - filled_length)
 
-    print(f'\r{prefix} |{bar}| {percent:.1f}% ({current}/{total})', end='', flush=True)
+    write = sys.stdout.write
+    write(f'\r{prefix} |{bar}| {percent:.1f}% ({current}/{total})')
 
     if current == total:
-        print()  # New line when complete
+        write('\n')  # New line when complete
+    sys.stdout.flush()
 
 
 def format_duration(seconds):
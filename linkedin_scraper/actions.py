@@ -1,5 +1,7 @@
 import getpass
+import weakref
 from . import constants as c
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,6 +15,26 @@ def page_has_loaded(driver):
     page_state = driver.execute_script('return document.readyState;')
     return page_state == 'complete'
 
+# URL patterns currently blocked on each driver; entries go away with the driver
+_blocked_urls = weakref.WeakKeyDictionary()
+
+def block_urls(driver, patterns):
+    """
+    Block requests matching `patterns` on `driver` via Chrome DevTools,
+    replacing any earlier list; an empty list unblocks everything.
+    Repeat calls with the same list cost nothing. Drivers without CDP
+    print a warning and keep loading everything.
+    """
+    patterns = tuple(patterns)
+    if _blocked_urls.get(driver, ()) == patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        _blocked_urls[driver] = patterns
+    except (AttributeError, WebDriverException) as e:
+        print(f"   ⚠️  Could not configure resource blocking: {e}")
+
 def login(driver, email=None, password=None, cookie = None, timeout=10):
     if cookie is not None:
         return _login_with_cookie(driver, cookie)
@@ -37,6 +59,20 @@ def login(driver, email=None, password=None, cookie = None, timeout=10):
   
     element = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, c.VERIFY_LOGIN_ID)))
   
+def login_if_needed(driver, email=None, password=None, timeout=10):
+    """
+    Log in only when the browser has no LinkedIn session yet, e.g. with a
+    Chrome profile (--user-data-dir) that kept the cookies of an earlier run.
+    Returns True if a login was performed, False if already logged in.
+    """
+    driver.get("https://www.linkedin.com/feed/")
+    # Logged-out visitors are redirected to the login page or the authwall
+    if "login" not in driver.current_url and "authwall" not in driver.current_url:
+        return False
+
+    login(driver, email, password, timeout=timeout)
+    return True
+
 def _login_with_cookie(driver, cookie):
     driver.get("https://www.linkedin.com/login")
     driver.add_cookie({
@@ -1,2 +1,36 @@
+import re
+
 VERIFY_LOGIN_ID = "global-nav__primary-link"
 REMEMBER_PROMPT = 'remember-me-prompt__form-primary'
+
+# Profile ID from a profile URL, e.g. /in/john-doe/ -> john-doe
+PROFILE_ID_RE = re.compile(r'/in/([^/?]+)')
+
+# First profile link under arguments[0] as {href, name, id}, or null.
+# One execute_script call instead of get_attribute/text per anchor.
+POSTER_LINK_SCRIPT = r"""
+const root = arguments[0];
+for (const a of root.querySelectorAll('a[href*="/in/"]')) {
+    const m = a.href.match(/\/in\/([^/?]+)/);
+    if (m) return {href: a.href.split('?')[0], name: a.innerText.trim(), id: m[1]};
+}
+return null;
+"""
+
+# Requests blocked via CDP while scraping job pages: images, fonts and
+# analytics beacons are never needed to read the job text
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.ttf",
+    "*/li/track*", "*google-analytics*", "*doubleclick*",
+]
+
+# Stylesheets are also blocked on job detail pages, which are read as text
+# only; search pagination needs layout to scroll, so it keeps them
+MINIMAL_ASSETS_URL_PATTERNS = BLOCKED_URL_PATTERNS + ["*.css"]
+
+# Chrome prefs for drivers that never need images; pass with
+# options.add_experimental_option("prefs", MINIMAL_ASSETS_PREFS)
+MINIMAL_ASSETS_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
@@ -4,6 +4,7 @@ Extended Job class that includes job poster/recruiter information extraction
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
 from .jobs import Job
+from . import constants as c
 
 
 class JobExtended(Job):
@@ -115,23 +116,12 @@ class JobExtended(Job):
             # Try to find the poster's profile link
             try:
                 # Look for anchor tag with linkedin.com/in/ URL
-                links = poster_container.find_elements(By.TAG_NAME, "a")
-                for link in links:
-                    href = link.get_attribute("href")
-                    if href and "/in/" in href:
-                        self.poster_profile_url = href.split("?")[0]  # Remove query params
-
-                        # Extract profile ID from URL
-                        # Format: https://www.linkedin.com/in/profile-id/
-                        if "/in/" in self.poster_profile_url:
-                            profile_id = self.poster_profile_url.split("/in/")[1].rstrip("/")
-                            self.poster_profile_id = profile_id
-
-                        # Get poster name from link text
-                        poster_name_text = link.text.strip()
-                        if poster_name_text:
-                            self.poster_name = poster_name_text
-                        break
+                poster_link = self.driver.execute_script(c.POSTER_LINK_SCRIPT, poster_container)
+                if poster_link:
+                    self.poster_profile_url = poster_link['href']
+                    self.poster_profile_id = poster_link['id']
+                    if poster_link['name']:
+                        self.poster_name = poster_link['name']
             except (NoSuchElementException, Exception) as e:
                 print(f"⚠️  Could not extract poster profile link: {e}")
 
@@ -7,18 +7,209 @@ Key insight: LinkedIn uses randomized class names, so we use:
 - Page title parsing
 - Visible text matching
 """
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import html
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .objects import Scraper
-import time
+from .actions import block_urls
+from . import constants as c
+import queue
 import re
 
 
+# Plain HTTP fetch of job pages (JobScraperV2 fast path)
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+HTTP_TIMEOUT = 10  # seconds
+# Statuses LinkedIn answers with when rate limiting (999 is its own)
+THROTTLED_STATUS_CODES = (429, 999)
+
+# The logged-out job page uses stable (non-obfuscated) top card classes
+GUEST_JOB_XPATHS = {
+    "job_title": "//h1[contains(@class, 'top-card-layout__title')]",
+    "company": "//a[contains(@class, 'topcard__org-name-link')]",
+    "location": "//span[contains(@class, 'topcard__flavor--bullet')]",
+    "posted_date": "//span[contains(@class, 'posted-time-ago__text')]",
+    "applicant_count": "//*[contains(@class, 'num-applicants__caption')]",
+}
+GUEST_DESCRIPTION_XPATH = "//div[contains(@class, 'show-more-less-html__markup')]"
+GUEST_RECRUITER_LINK_XPATH = "//div[contains(@class, 'message-the-recruiter')]//a[contains(@href, '/in/')]"
+
+# Job card selectors, most specific first (/search-results/ semantic search
+# pages use scaffold-layout, classic /search/ pages use data-occludable-job-id)
+JOB_CARD_SELECTORS = (
+    "li.scaffold-layout__list-item",
+    "li[data-occludable-job-id]",
+    "li.jobs-search-results__list-item",
+    "div.job-card-container",
+    "div.jobs-search__job-card-wrapper",
+)
+JOB_CARD_LINK_SELECTORS = (
+    "a[href*='/jobs/view/']",  # Traditional format
+    "a[href*='currentJobId=']",  # Semantic search format
+    "a.job-card-list__title",
+    "a.job-card-container__link",
+    "a.job-card__link",
+    "a",  # Any link as fallback
+)
+# Comma-joined so the browser parses each list once and checks every
+# variant in a single querySelector call
+JOB_CARD_LINK_SELECTOR = ", ".join(JOB_CARD_LINK_SELECTORS)
+JOB_LIST_CONTAINER_SELECTOR = ", ".join((
+    "div.jobs-search-results-list",
+    "div.scaffold-layout__list",
+    "ul.jobs-search-results__list",
+))
+
+# Scroll the window and the job list pane to the bottom to reveal the
+# pagination controls; returns whether a pane was found
+SCROLL_TO_PAGINATION_SCRIPT = """
+window.scrollTo(0, document.body.scrollHeight);
+const pane = document.querySelector(arguments[0]);
+if (pane) pane.scrollTop = pane.scrollHeight;
+return !!pane;
+"""
+# Next page control: LinkedIn may use <button> or <a> elements for pagination.
+# Tried most specific first; the last resort is any button in a pagination block
+FIND_NEXT_BUTTON_SCRIPT = """
+return document.querySelector(
+        'button[aria-label="View next page"], button[aria-label="Next"], ' +
+        'button.jobs-search-pagination__button--next, a[aria-label="Next"]')
+    || Array.from(document.querySelectorAll('button, a')).find(el => el.textContent.trim() === 'Next')
+    || document.querySelector('div[class*="pagination"] button')
+    || null;
+"""
+
+# Scroll the Next element into view and report {tag, clickable}: buttons must
+# not be disabled, links must not be aria-disabled, anything else is tried
+NEXT_BUTTON_STATE_SCRIPT = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center'});
+const tag = el.tagName.toLowerCase();
+const clickable = tag === 'button' ? !el.disabled
+    : tag === 'a' ? el.getAttribute('aria-disabled') !== 'true'
+    : true;
+return {tag, clickable};
+"""
+
+# For the first card selector that matches, each card's data-job-id or else
+# the href of its first job link, as {selector, refs}; null if no cards
+CARD_JOB_REFS_SCRIPT = """
+const [cardSelectors, linkSelector] = arguments;
+const isJobLink = href => href && (href.includes('/jobs/view/') || href.includes('currentJobId='));
+for (const selector of cardSelectors) {
+    const cards = document.querySelectorAll(selector);
+    if (!cards.length) continue;
+    return {selector, refs: Array.from(cards, card => {
+        const wrapper = card.querySelector('div[data-job-id]');
+        if (wrapper && wrapper.getAttribute('data-job-id')) return wrapper.getAttribute('data-job-id');
+        const link = Array.from(card.querySelectorAll(linkSelector)).find(a => isJobLink(a.href));
+        return link ? link.href : null;
+    })};
+}
+return null;
+"""
+
+# Cards counted while scrolling and awaited after navigation
+JOB_CARD_SELECTOR = "li[data-occludable-job-id], li.jobs-search-results__list-item, li.scaffold-layout__list-item"
+FIRST_CARD_JOB_ID_SCRIPT = """
+const card = document.querySelector('[data-job-id], [data-occludable-job-id]');
+return card ? (card.getAttribute('data-job-id') || card.getAttribute('data-occludable-job-id')) : null;
+"""
+# Scroll to the bottom, then resolve with the card count as soon as a
+# MutationObserver sees new cards, or after timeoutMs with the same count
+SCROLL_FOR_MORE_CARDS_SCRIPT = """
+const [cardSelector, containerSelector, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const count = () => document.querySelectorAll(cardSelector).length;
+const start = count();
+const root = document.querySelector(containerSelector) || document.body;
+let timer;
+const observer = new MutationObserver(() => {
+    const n = count();
+    if (n > start) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(n);
+    }
+});
+observer.observe(root, {childList: true, subtree: true});
+timer = setTimeout(() => { observer.disconnect(); done(count()); }, timeoutMs);
+window.scrollTo(0, document.body.scrollHeight);
+if (root !== document.body) root.scrollTop = root.scrollHeight;
+"""
+PAGE_LOAD_TIMEOUT = 10  # seconds
+NEXT_BUTTON_TIMEOUT = 3  # seconds
+JOB_TITLE_TIMEOUT = 5  # seconds
+
+DESCRIPTION_MAX_BLOCKS = 15  # <p>/<ul> blocks kept for job_description
+DESCRIPTION_MAX_CHARS = 8000  # stop collecting blocks past this many characters
+
+CURRENT_JOB_ID_RE = re.compile(r'currentJobId=(\d+)')
+# Segments of "City, State, Country · X weeks ago · Y applicants"
+POSTED_SEGMENT_RE = re.compile(r'[^·]*\bago\b[^·]*', re.IGNORECASE)
+APPLICANTS_SEGMENT_RE = re.compile(r'[^·]*\bapplicants?\b[^·]*', re.IGNORECASE)
+
+# Page title, text of every <p> and <ul> plus company links, for JobScraperV2._extract_job_info
+PAGE_TEXT_SCRIPT = """
+const texts = selector => Array.from(document.querySelectorAll(selector), e => e.innerText.trim());
+return {
+    title: document.title,
+    ps: texts('p'),
+    uls: texts('ul'),
+    company_links: Array.from(
+        document.querySelectorAll("a[href*='/company/']"),
+        a => ({text: a.innerText.trim(), href: a.href})
+    ),
+};
+"""
+
+# Text and href of every profile link, for JobScraperV2._extract_poster_info
+PROFILE_LINKS_SCRIPT = """
+return Array.from(
+    document.querySelectorAll("a[href*='/in/']"),
+    a => ({text: a.innerText.trim(), href: a.href})
+);
+"""
+
+_session = None
+
+
+def build_session(pool_size=20):
+    """Create a requests.Session with browser-like headers and a connection pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+
+def get_session():
+    """Shared session so every JobScraperV2 reuses the same pooled connections"""
+    global _session
+    if _session is None:
+        _session = build_session()
+    return _session
+
+
 class SearchResultsScraper(Scraper):
     """
     Scrapes all job listings from a LinkedIn search results page.
+
+    Pagination runs on the caller's logged-in Selenium driver, since search
+    results need that session. Every step waits on a DOM condition (cards
+    present, first card changed, Next button rendered) instead of sleeping.
     """
 
     def __init__(
@@ -36,12 +227,23 @@ class SearchResultsScraper(Scraper):
         self.max_pages = max_pages
         self.scroll_pause = scroll_pause
         self.job_urls = []
+        self._seen = set()  # Mirrors job_urls for O(1) membership checks
 
     def get_all_job_urls(self):
         """
         Extract all job URLs from the search results page with pagination.
         Loops through all pages by clicking the Next button.
         """
+        for _ in self.iter_job_urls():
+            pass
+        return self.job_urls
+
+    def iter_job_urls(self):
+        """
+        Yield job URLs page by page as pagination finds them, so callers can
+        start scraping page 1 while later pages are still loading.
+        Every yielded URL is also appended to self.job_urls.
+        """
         if not self.search_url:
             raise ValueError("search_url is required")
 
@@ -49,8 +251,10 @@ class SearchResultsScraper(Scraper):
             raise ValueError("driver is required")
 
         print(f"\n🔍 Loading search results: {self.search_url}")
+        # Pagination scrolls the results pane, which needs its stylesheets
+        block_urls(self.driver, [])
         self.driver.get(self.search_url)
-        time.sleep(3)
+        self._wait_for_job_cards()
 
         page = 1
 
@@ -72,64 +276,80 @@ class SearchResultsScraper(Scraper):
             if self.max_jobs and len(self.job_urls) >= self.max_jobs:
                 print(f"   Reached max_jobs limit ({self.max_jobs})")
                 self.job_urls = self.job_urls[:self.max_jobs]
+                yield from self.job_urls[page_jobs_before:]
                 break
 
+            yield from self.job_urls[page_jobs_before:]
+
             # Check if we've reached max_pages limit
             if self.max_pages and page >= self.max_pages:
                 print(f"   Reached max_pages limit ({self.max_pages})")
                 break
 
             # Try to click Next button to go to next page
+            first_job_id = self._first_card_job_id()
             if self._click_next_button():
                 print(f"   ✓ Clicked Next button, loading page {page + 1}...")
-                time.sleep(3)  # Wait for new page to load
+                self._wait_for_page_change(first_job_id)
                 page += 1
             else:
                 print(f"   ✗ No Next button found - reached last page")
                 break
 
         print(f"\n✅ Pagination complete! Collected {len(self.job_urls)} job URLs across {page} page(s)")
-        return self.job_urls
+
+    def _wait_for_job_cards(self):
+        """Wait for the first job card to render; a timeout is not an error"""
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+            )
+        except TimeoutException:
+            pass
+
+    def _first_card_job_id(self):
+        """data-job-id of the first card on the page, or None"""
+        try:
+            return self.driver.execute_script(FIRST_CARD_JOB_ID_SCRIPT)
+        except Exception:
+            return None
+
+    def _wait_for_page_change(self, previous_job_id):
+        """After clicking Next, wait until the first card is a different job"""
+        def page_changed(driver):
+            job_id = self._first_card_job_id()
+            return job_id is not None and job_id != previous_job_id
+
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT, poll_frequency=0.1).until(page_changed)
+        except TimeoutException:
+            pass
 
     def _scroll_to_load_jobs_on_current_page(self):
         """Scroll down the page to load all job listings on the CURRENT page"""
         print("   📜 Scrolling left sidebar...")
 
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
         jobs_loaded = 0
+        timeout_ms = int(self.scroll_pause * 1000)
 
         while True:
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(self.scroll_pause)
-
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            # Scroll down; the browser reports back as soon as new cards render
+            count = self.driver.execute_async_script(
+                SCROLL_FOR_MORE_CARDS_SCRIPT, JOB_CARD_SELECTOR, JOB_LIST_CONTAINER_SELECTOR, timeout_ms
+            )
 
-            # Count current jobs
-            try:
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR,
-                    "li[data-occludable-job-id], li.jobs-search-results__list-item, li.scaffold-layout__list-item")
-                current_count = len(job_cards)
-
-                if current_count > jobs_loaded:
-                    jobs_loaded = current_count
-                    print(f"      Loaded {jobs_loaded} jobs so far...")
-
-                # Stop if max_jobs reached (check total collected, not just current page)
-                if self.max_jobs and len(self.job_urls) + jobs_loaded >= self.max_jobs:
-                    print(f"      Approaching max_jobs limit")
-                    break
+            # Break if no new cards loaded within scroll_pause
+            if count <= jobs_loaded:
+                break
+            jobs_loaded = count
 
-            except:
-                pass
+            print(f"      Loaded {jobs_loaded} jobs so far...")
 
-            # Break if no new content loaded
-            if new_height == last_height:
+            # Stop if max_jobs reached (check total collected, not just current page)
+            if self.max_jobs and len(self.job_urls) + jobs_loaded >= self.max_jobs:
+                print(f"      Approaching max_jobs limit")
                 break
 
-            last_height = new_height
-
         print(f"      ✓ Finished scrolling current page. {jobs_loaded} job cards visible")
 
     def _extract_job_urls_from_current_page(self):
@@ -138,87 +358,48 @@ class SearchResultsScraper(Scraper):
 
         # Try multiple selectors for job cards
         # Different selectors for /search/ vs /search-results/ URLs
-        job_card_selectors = [
-            "li.scaffold-layout__list-item",  # NEW: Works for /search-results/ (semantic search)
-            "li[data-occludable-job-id]",  # Works for /search/ URLs
-            "li.jobs-search-results__list-item",
-            "div.job-card-container",
-            "div.jobs-search__job-card-wrapper",
-        ]
-
-        job_cards = []
-        for selector in job_card_selectors:
-            try:
-                cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if cards:
-                    job_cards = cards
-                    print(f"      Found {len(cards)} job cards using selector: {selector}")
-                    break
-            except:
-                continue
+        # One script reads every card's job ID or link instead of several
+        # find_element/get_attribute round-trips per card
+        result = self.driver.execute_script(CARD_JOB_REFS_SCRIPT, JOB_CARD_SELECTORS, JOB_CARD_LINK_SELECTOR)
 
-        if not job_cards:
+        if not result:
             print("      ⚠️  No job cards found on page")
             return
 
-        # Extract URLs from job cards
-        for card in job_cards:
-            try:
-                job_id = None
+        print(f"      Found {len(result['refs'])} job cards using selector: {result['selector']}")
 
-                # METHOD 1: Try to get job ID from data-job-id attribute (works for semantic search)
-                try:
-                    job_card_wrapper = card.find_element(By.CSS_SELECTOR, "div[data-job-id]")
-                    job_id = job_card_wrapper.get_attribute("data-job-id")
-                except:
-                    pass
-
-                # METHOD 2: Try to extract from link href
-                if not job_id:
-                    link_selectors = [
-                        "a[href*='/jobs/view/']",  # Traditional format
-                        "a[href*='currentJobId=']",  # Semantic search format
-                        "a.job-card-list__title",
-                        "a.job-card-container__link",
-                        "a.job-card__link",
-                        "a",  # Any link as fallback
-                    ]
-
-                    for link_selector in link_selectors:
-                        try:
-                            link = card.find_element(By.CSS_SELECTOR, link_selector)
-                            href = link.get_attribute("href")
-
-                            if href:
-                                # Extract from /jobs/view/{id}/ format
-                                if "/jobs/view/" in href:
-                                    job_id = href.split("/jobs/view/")[1].split("/")[0].split("?")[0]
-                                    break
-                                # Extract from currentJobId={id} format
-                                elif "currentJobId=" in href:
-                                    import re
-                                    match = re.search(r'currentJobId=(\d+)', href)
-                                    if match:
-                                        job_id = match.group(1)
-                                        break
-                        except:
-                            continue
-
-                # If we found a job ID, construct clean URL
-                if job_id and job_id.isdigit():
-                    clean_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-
-                    if clean_url not in self.job_urls:
-                        self.job_urls.append(clean_url)
-
-                        # Stop if max_jobs reached
-                        if self.max_jobs and len(self.job_urls) >= self.max_jobs:
-                            print(f"      Reached max_jobs limit ({self.max_jobs})")
-                            return
-
-            except Exception as e:
+        # Extract URLs from job cards
+        for ref in result["refs"]:
+            if not ref:
                 continue
 
+            # METHOD 1: data-job-id attribute (works for semantic search)
+            if ref.isdigit():
+                job_id = ref
+            else:
+                # METHOD 2: Extract from /jobs/view/{id}/ format (the id may
+                # end a "title-at-company-{id}" slug)
+                _, sep, rest = ref.partition("/jobs/view/")
+                if sep:
+                    job_id = rest.partition("/")[0].partition("?")[0].rpartition("-")[2]
+                # Extract from currentJobId={id} format
+                else:
+                    match = CURRENT_JOB_ID_RE.search(ref)
+                    job_id = match.group(1) if match else None
+
+            # If we found a job ID, construct clean URL
+            if job_id and job_id.isdigit():
+                clean_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+                if clean_url not in self._seen:
+                    self._seen.add(clean_url)
+                    self.job_urls.append(clean_url)
+
+                    # Stop if max_jobs reached
+                    if self.max_jobs and len(self.job_urls) >= self.max_jobs:
+                        print(f"      Reached max_jobs limit ({self.max_jobs})")
+                        return
+
     def _click_next_button(self):
         """
         Try to click the Next button to go to the next page.
@@ -230,92 +411,34 @@ class SearchResultsScraper(Scraper):
             # First, scroll down the page to make sure Next button is visible
             # The Next button is usually at the bottom of the left sidebar
             print("      Scrolling to reveal Next button...")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            # Scroll the window and the job results container in one call
+            if self.driver.execute_script(SCROLL_TO_PAGINATION_SCRIPT, JOB_LIST_CONTAINER_SELECTOR):
+                print(f"      Scrolled job list container")
 
-            # Try to find and scroll the job results container specifically
+            # One in-page scan for the Next button/link, retried briefly
+            # while the pagination controls render after scrolling
             try:
-                # Find the left sidebar container
-                job_list_selectors = [
-                    "div.jobs-search-results-list",
-                    "div.scaffold-layout__list",
-                    "ul.jobs-search-results__list",
-                ]
-
-                for selector in job_list_selectors:
-                    try:
-                        container = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        # Scroll this container to bottom to reveal pagination
-                        self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
-                        time.sleep(1)
-                        print(f"      Scrolled job list container: {selector}")
-                        break
-                    except:
-                        continue
-            except:
-                pass
-
-            # Multiple selector strategies for Next button/link
-            # LinkedIn may use <button> or <a> elements for pagination
-            next_selectors = [
-                '//button[@aria-label="View next page"]',  # PRIMARY: Job search pagination (confirmed working)
-                '//button[@aria-label="Next"]',  # Alternative pagination
-                '//span[text()="Next"]/parent::button',  # Button containing span with "Next" text
-                '//button[.//text()="Next"]',  # Button with "Next" anywhere in text content
-                '//button[contains(@class, "jobs-search-pagination__button--next")]',  # By class name
-                '//a[@aria-label="Next"]',  # Link with aria-label
-                '//a[contains(text(), "Next")]',  # Link with "Next" text
-                '//div[contains(@class, "pagination")]//button',  # Any button in pagination container
-            ]
-
-            next_element = None
-            used_selector = None
-
-            # Try each selector until we find one that works
-            for selector in next_selectors:
-                try:
-                    element = self.driver.find_element(By.XPATH, selector)
-                    if element:
-                        next_element = element
-                        used_selector = selector
-                        print(f"      Found Next element using: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
-
-            if not next_element:
-                print(f"      Next button/link not found (tried {len(next_selectors)} selectors)")
+                next_element = WebDriverWait(self.driver, NEXT_BUTTON_TIMEOUT, poll_frequency=0.1).until(
+                    lambda driver: driver.execute_script(FIND_NEXT_BUTTON_SCRIPT)
+                )
+            except TimeoutException:
+                print(f"      Next button/link not found")
                 return False
 
-            # Check if element is clickable (not disabled)
-            # For <a> elements, check if href exists or if it has aria-disabled
-            is_clickable = False
+            # Check if element is clickable (not disabled) and scroll it into
+            # view in the same call
+            state = self.driver.execute_script(NEXT_BUTTON_STATE_SCRIPT, next_element)
 
-            if next_element.tag_name == "button":
-                is_clickable = next_element.is_enabled()
-                if not is_clickable:
+            if not state["clickable"]:
+                if state["tag"] == "button":
                     print(f"      Next button is disabled")
-            elif next_element.tag_name == "a":
-                # Check if link has aria-disabled attribute
-                aria_disabled = next_element.get_attribute("aria-disabled")
-                if aria_disabled == "true":
-                    print(f"      Next link is disabled (aria-disabled=true)")
-                    is_clickable = False
                 else:
-                    is_clickable = True
-            else:
-                # Unknown element type, try clicking anyway
-                is_clickable = True
-
-            if is_clickable:
-                # Scroll element into view before clicking
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_element)
-                time.sleep(0.5)
-                next_element.click()
-                return True
-            else:
+                    print(f"      Next link is disabled (aria-disabled=true)")
                 return False
 
+            next_element.click()
+            return True
+
         except Exception as e:
             print(f"      Error clicking Next button: {e}")
             return False
@@ -332,10 +455,17 @@ class JobScraperV2(Scraper):
         linkedin_url=None,
         driver=None,
         close_on_complete=True,
+        session=None,
+        minimal_assets=True,
     ):
         super().__init__()
         self.linkedin_url = linkedin_url
         self.driver = driver
+        self.session = session  # requests.Session for the HTTP fast path (default: shared)
+        self.minimal_assets = minimal_assets  # Skip images/CSS/fonts when loading in the browser
+        self._from_html = False
+        # True if LinkedIn rate limited the HTTP fetch, so callers can back off
+        self.throttled = False
 
         # Job data fields
         self.job_title = None
@@ -353,22 +483,128 @@ class JobScraperV2(Scraper):
         self.poster_profile_url = None
         self.poster_profile_id = None
 
-        if self.linkedin_url and self.driver:
+        if self.linkedin_url and (self.driver or self.session):
             self.scrape(close_on_complete)
 
+    @classmethod
+    def scrape_many(cls, urls, session=None, drivers=None, max_workers=8):
+        """
+        Scrape many job URLs concurrently.
+
+        Every worker fetches over the same pooled HTTP session. Jobs that
+        need the browser (gated page, hidden hiring team) check a driver
+        out of `drivers` for just that step; without drivers they keep
+        whatever the HTTP fetch found.
+
+        Returns:
+            list: JobScraperV2 objects, in completion order
+        """
+        session = session or get_session()
+        pool = queue.Queue()
+        for driver in drivers or ():
+            pool.put(driver)
+
+        def scrape_one(url):
+            job = cls(url, session=session)
+            if drivers and job.needs_browser():
+                driver = pool.get()
+                try:
+                    job.finish_with_browser(driver)
+                finally:
+                    pool.put(driver)
+            return job
+
+        jobs = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(scrape_one, url): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    jobs.append(future.result())
+                except Exception as e:
+                    print(f"❌ Error scraping {futures[future]}: {e}")
+        return jobs
+
+    @classmethod
+    def scrape_list(cls, driver, urls, prefetch=3):
+        """
+        Scrape job URLs in the browser, keeping the next `prefetch` pages
+        loading in background tabs while the current one is parsed.
+
+        Returns:
+            list: JobScraperV2 objects for the URLs that scraped successfully
+        """
+        main_window = driver.current_window_handle
+        remaining = iter(urls)
+        pending = deque()  # (url, window handle), oldest first
+
+        def open_next():
+            url = next(remaining, None)
+            if url is None:
+                return
+            before = set(driver.window_handles)
+            driver.switch_to.window(main_window)
+            driver.execute_script("window.open(arguments[0], '_blank');", url)
+            new_handles = set(driver.window_handles) - before
+            if new_handles:
+                pending.append((url, new_handles.pop()))
+
+        for _ in range(prefetch):
+            open_next()
+
+        jobs = []
+        try:
+            while pending:
+                url, handle = pending.popleft()
+                driver.switch_to.window(handle)
+                print(f"\n🔍 Scraping: {url}")
+                try:
+                    job = cls(driver=driver)  # no URL yet, so nothing is scraped
+                    job.linkedin_url = url
+                    job._wait_for_job_page()
+                    job._extract_job_info()
+                    job._extract_poster_info()
+                    print(f"✅ Scraped: {job.job_title} at {job.company}")
+                    jobs.append(job)
+                except Exception as e:
+                    print(f"❌ Error scraping {url}: {e}")
+                finally:
+                    driver.close()
+                    open_next()
+        finally:
+            for _, handle in pending:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(main_window)
+
+        return jobs
+
+    def needs_browser(self):
+        """True if the HTTP fast path left work for the logged-in browser"""
+        return not self._from_html or not self.poster_profile_url
+
+    def finish_with_browser(self, driver):
+        """
+        Fill in whatever the HTTP fast path missed, borrowing `driver` for
+        this call only (e.g. checked out of a shared pool of browsers).
+        """
+        self.driver = driver
+        try:
+            self._scrape_with_browser()
+        finally:
+            self.driver = None
+
     def scrape(self, close_on_complete=True):
         """Scrape job with structure-based queries"""
         try:
             print(f"\n🔍 Scraping: {self.linkedin_url}")
 
-            self.driver.get(self.linkedin_url)
-            time.sleep(3)  # Wait for page to load
-
-            # Extract basic job info
-            self._extract_job_info()
+            # Fast path: plain HTTP fetch, no browser round-trips
+            self._from_html = self._scrape_from_html()
 
-            # Extract poster info
-            self._extract_poster_info()
+            if self.driver:
+                self._scrape_with_browser()
+            elif not self._from_html:
+                print(f"   ⚠️  Guest page unavailable; needs the browser")
 
             print(f"✅ Scraped: {self.job_title} at {self.company}")
             if self.poster_name:
@@ -381,175 +617,255 @@ class JobScraperV2(Scraper):
             print(f"❌ Error scraping {self.linkedin_url}: {e}")
             raise
 
+    def _wait_for_job_page(self):
+        """Wait until the job page title ("Title | Company | LinkedIn") is set"""
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.TAG_NAME, "title"))
+            )
+            WebDriverWait(self.driver, JOB_TITLE_TIMEOUT, poll_frequency=0.1).until(
+                lambda driver: " | " in driver.title
+            )
+        except TimeoutException:
+            pass
+
+    def _scrape_with_browser(self):
+        """Fill in whatever the HTTP fast path could not get, using the driver"""
+        if not self.needs_browser():
+            return
+
+        # Gated page, or the logged-out page hid the hiring team
+        block_urls(self.driver, c.MINIMAL_ASSETS_URL_PATTERNS if self.minimal_assets else [])
+        self.driver.get(self.linkedin_url)
+        self._wait_for_job_page()
+
+        if not self._from_html:
+            # Extract basic job info
+            self._extract_job_info()
+
+        if not self.poster_profile_url:
+            # Extract poster info
+            self._extract_poster_info()
+
+    def _scrape_from_html(self):
+        """
+        Fetch the job page over HTTP and parse it with lxml.
+        Returns False when LinkedIn gates the page (login wall, rate limit)
+        or the top card is missing, so the caller falls back to Selenium.
+        """
+        try:
+            resp = (self.session or get_session()).get(self.linkedin_url, timeout=HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"   ⚠️  HTTP fetch failed, using browser: {e}")
+            return False
+
+        # 401/403/429/999 or a redirect to the auth wall: needs the logged-in browser
+        if resp.status_code != 200 or "authwall" in resp.url:
+            self.throttled = resp.status_code in THROTTLED_STATUS_CODES
+            print(f"   ⚠️  Job page gated (HTTP {resp.status_code}), using browser")
+            return False
+
+        # LinkedIn soft-throttles with an empty 200, which lxml can't parse
+        if not resp.content.strip():
+            self.throttled = True
+            print(f"   ⚠️  Job page empty (throttled), using browser")
+            return False
+
+        tree = html.fromstring(resp.content)
+
+        for field, xpath in GUEST_JOB_XPATHS.items():
+            nodes = tree.xpath(xpath)
+            if nodes:
+                setattr(self, field, " ".join(nodes[0].text_content().split()) or None)
+
+        company_links = tree.xpath(GUEST_JOB_XPATHS["company"])
+        if company_links:
+            self.company_linkedin_url = company_links[0].get("href")
+
+        description = tree.xpath(GUEST_DESCRIPTION_XPATH)
+        if description:
+            self.job_description = description[0].text_content().strip() or None
+
+        if not (self.job_title and self.company):
+            print(f"   ⚠️  Job page has no top card, using browser")
+            return False
+
+        # Logged-out pages show the poster as a plain recruiter card
+        recruiter_links = tree.xpath(GUEST_RECRUITER_LINK_XPATH)
+        if recruiter_links:
+            link = recruiter_links[0]
+            if link.get("href"):
+                self._set_poster(link.text_content().strip(), link.get("href"))
+
+        print(f"   ✓ Extracted via HTTP: {self.job_title} at {self.company}")
+        return True
+
     def _extract_job_info(self):
         """Extract job information using structure and text patterns"""
 
-        # 1. Parse page title first (most reliable)
+        # Read the page title, every <p>/<ul> text and company link in one
+        # round-trip; all filtering below runs in Python over these values
         try:
-            title_text = self.driver.title
-            if " | " in title_text:
-                parts = title_text.split(" | ")
-                self.job_title = parts[0].strip() if len(parts) > 0 else None
-                self.company = parts[1].strip() if len(parts) > 1 else None
-                print(f"   ✓ Extracted from page title: {self.job_title} at {self.company}")
+            page = self.driver.execute_script(PAGE_TEXT_SCRIPT)
         except Exception as e:
-            print(f"   ⚠️  Could not parse page title: {e}")
+            print(f"   ⚠️  Could not read page text: {e}")
+            return
 
-        # 2. Find job title in <p> tag (if not from title)
-        if not self.job_title:
-            try:
-                # Find <p> tags with substantial text that might be job title
-                p_tags = self.driver.find_elements(By.TAG_NAME, "p")
-                for p in p_tags:
-                    text = p.text.strip()
-                    # Job titles are usually short (5-50 chars) and don't contain special patterns
-                    if text and 5 < len(text) < 50 and "·" not in text and "\n" not in text:
-                        self.job_title = text
-                        print(f"   ✓ Found job title in <p>: {self.job_title}")
-                        break
-            except:
-                pass
+        # 1. Parse page title first (most reliable)
+        title_text = page["title"] or ""
+        if " | " in title_text:
+            parts = title_text.split(" | ")
+            self.job_title = parts[0].strip() if len(parts) > 0 else None
+            self.company = parts[1].strip() if len(parts) > 1 else None
+            print(f"   ✓ Extracted from page title: {self.job_title} at {self.company}")
+
+        # One pass over the <p> texts feeds every <p>-based step:
+        # 2. job title (if not from title), 4. location/date line,
+        # 5. description blocks, 6. salary/benefits
+        need_title = not self.job_title
+        location_text = None
+        description_parts = []
+        description_chars = 0
+
+        for text in page["ps"]:
+            lowered = text.lower()
+
+            # Job titles are usually short (5-50 chars) and don't contain special patterns
+            if need_title and 5 < len(text) < 50 and "·" not in text and "\n" not in text:
+                self.job_title = text
+                need_title = False
+                print(f"   ✓ Found job title in <p>: {self.job_title}")
+
+            # Location/date format: "City, State, Country · X weeks ago · Y applicants"
+            if location_text is None and "·" in text and ("ago" in lowered or "applicant" in lowered):
+                location_text = text
+
+            # Skip: short text, navigation items, metadata
+            if (len(description_parts) < DESCRIPTION_MAX_BLOCKS and
+                description_chars < DESCRIPTION_MAX_CHARS and
+                len(text) > 50 and
+                "·" not in text and  # Skip metadata lines
+                "ago" not in lowered and  # Skip date lines
+                "applicant" not in lowered and  # Skip applicant count
+                "notification" not in lowered):  # Skip notifications
+                description_parts.append(text)
+                description_chars += len(text)
+
+            # Benefits often in their own section
+            if self.benefits is None and ("$" in text or "salary" in lowered or "compensation" in lowered):
+                self.benefits = text
+                print(f"   ✓ Found benefits: {self.benefits}")
 
         # 3. Find company from links (always try to get URL even if we have name)
-        try:
-            company_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/company/')]")
-            for link in company_links:
-                text = link.text.strip()
-                href = link.get_attribute("href")
-                if text and len(text) > 2:  # Company name should have substance
-                    if not self.company:
-                        self.company = text
-                    self.company_linkedin_url = href
-                    print(f"   ✓ Found company link: {self.company} - {href}")
-                    break
-        except:
-            pass
+        company_links = page["company_links"] if not (self.company and self.company_linkedin_url) else []
+        for link in company_links:
+            text = link["text"]
+            href = link["href"]
+            if text and len(text) > 2:  # Company name should have substance
+                if not self.company:
+                    self.company = text
+                self.company_linkedin_url = href
+                print(f"   ✓ Found company link: {self.company} - {href}")
+                break
 
-        # 4. Find location and date (they're together in one <p> with "·" separator)
-        try:
-            p_tags = self.driver.find_elements(By.TAG_NAME, "p")
-            for p in p_tags:
-                text = p.text.strip()
-                # Location/date format: "City, State, Country · X weeks ago · Y applicants"
-                if "·" in text and ("ago" in text.lower() or "applicant" in text.lower()):
-                    parts = text.split("·")
-                    self.location = parts[0].strip() if len(parts) > 0 else None
-
-                    # Find "ago" part for posted date
-                    for part in parts:
-                        if "ago" in part.lower():
-                            self.posted_date = part.strip()
-                        if "applicant" in part.lower():
-                            self.applicant_count = part.strip()
-
-                    print(f"   ✓ Found location: {self.location}")
-                    print(f"   ✓ Posted: {self.posted_date}, {self.applicant_count}")
-                    break
-        except Exception as e:
-            print(f"   ⚠️  Could not extract location/date: {e}")
+        # 4. Split the location/date line
+        if location_text:
+            self.location = location_text.partition("·")[0].strip()
 
-        # 5. Find job description (large text blocks in <p> and <ul> tags)
-        try:
-            description_parts = []
-
-            # Strategy: Collect all substantial text from <p> and <ul> tags
-            # Skip: navigation, headers, short text
-            all_p = self.driver.find_elements(By.TAG_NAME, "p")
-            all_ul = self.driver.find_elements(By.TAG_NAME, "ul")
-
-            print(f"   Found {len(all_p)} <p> tags and {len(all_ul)} <ul> tags")
-
-            # Collect from <p> tags
-            for p in all_p:
-                text = p.text.strip()
-                # Skip: short text, navigation items, metadata
-                if (len(text) > 50 and
-                    "·" not in text and  # Skip metadata lines
-                    "ago" not in text.lower() and  # Skip date lines
-                    "applicant" not in text.lower() and  # Skip applicant count
-                    "notification" not in text.lower()):  # Skip notifications
-                    description_parts.append(text)
-
-            # Collect from <ul> tags (requirements, skills, etc.)
-            for ul in all_ul:
-                text = ul.text.strip()
-                if len(text) > 50:
-                    description_parts.append(text)
-
-            if description_parts:
-                self.job_description = "\n\n".join(description_parts[:15])  # First 15 blocks
-                print(f"   ✓ Extracted description ({len(self.job_description)} chars from {len(description_parts[:15])} blocks)")
-            else:
-                print(f"   ⚠️  No substantial description text found")
+            # "ago" segment is the posted date, "applicant" segment the count
+            posted = POSTED_SEGMENT_RE.search(location_text)
+            if posted:
+                self.posted_date = posted.group(0).strip()
+            applicants = APPLICANTS_SEGMENT_RE.search(location_text)
+            if applicants:
+                self.applicant_count = applicants.group(0).strip()
 
-        except Exception as e:
-            print(f"   ⚠️  Could not extract description: {e}")
+            print(f"   ✓ Found location: {self.location}")
+            print(f"   ✓ Posted: {self.posted_date}, {self.applicant_count}")
 
-        # 6. Try to find salary/benefits
-        try:
-            # Benefits often in their own section
-            all_text = self.driver.find_elements(By.TAG_NAME, "p")
-            for elem in all_text:
-                text = elem.text.strip()
-                if "$" in text or "salary" in text.lower() or "compensation" in text.lower():
-                    self.benefits = text
-                    print(f"   ✓ Found benefits: {self.benefits}")
-                    break
-        except:
-            pass
+        # 5. Job description: substantial <p> blocks, then <ul> blocks
+        # (requirements, skills, etc.)
+        ul_texts = page["uls"]
+        print(f"   Found {len(page['ps'])} <p> tags and {len(ul_texts)} <ul> tags")
+
+        for text in ul_texts:
+            if len(description_parts) >= DESCRIPTION_MAX_BLOCKS or description_chars >= DESCRIPTION_MAX_CHARS:
+                break
+            if len(text) > 50:
+                description_parts.append(text)
+                description_chars += len(text)
+
+        if description_parts:
+            self.job_description = "\n\n".join(description_parts)
+            print(f"   ✓ Extracted description ({len(self.job_description)} chars from {len(description_parts)} blocks)")
+        else:
+            print(f"   ⚠️  No substantial description text found")
 
     def _extract_poster_info(self):
         """Extract job poster information using structure"""
         try:
-            # Look for profile links (contain "/in/")
-            profile_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/in/')]")
+            # Look for profile links (contain "/in/"), text and href in one call
+            profile_links = self.driver.execute_script(PROFILE_LINKS_SCRIPT)
 
             if profile_links:
-                for link in profile_links:
-                    href = link.get_attribute("href")
-                    text = link.text.strip()
-
-                    # Valid poster link should:
-                    # 1. Have text (name)
-                    # 2. Not be a random icon/image link
-                    # 3. Contain "Job poster" or be in hiring team section
-                    # Note: Text can be multi-line with name, title, "Job poster", etc.
-                    if text and len(text) > 2 and len(text) < 200:
-                        # Check if this is a job poster link
-                        if "job poster" in text.lower() or "hiring team" in text.lower() or "recruiter" in text.lower():
-                            self.poster_profile_url = href.split("?")[0]
-
-                            # Parse the multi-line text to extract name and headline
-                            lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-                            # First line is usually the name
-                            if lines:
-                                # Remove "• 3rd" or similar connection indicators
-                                name_line = lines[0].replace('•', '').replace('3rd', '').replace('2nd', '').replace('1st', '').strip()
-                                self.poster_name = name_line
-
-                            # Look for headline (usually contains "at" or job title keywords)
-                            for line in lines:
-                                if " at " in line.lower() or "recruiter" in line.lower() or "manager" in line.lower():
-                                    self.poster_headline = line.strip()
-                                    break
-
-                            # Extract profile ID from URL
-                            match = re.search(r'/in/([^/?]+)', self.poster_profile_url)
-                            if match:
-                                self.poster_profile_id = match.group(1)
-
-                            print(f"   ✓ Found poster: {self.poster_name} (ID: {self.poster_profile_id})")
-                            if self.poster_headline:
-                                print(f"   ✓ Found headline: {self.poster_headline}")
-
-                            break
+                self._match_poster_link((link["text"], link["href"]) for link in profile_links)
             else:
                 print(f"   ⚠️  No poster profile links found")
 
         except Exception as e:
             print(f"   ⚠️  Could not extract poster info: {e}")
 
+    def _match_poster_link(self, links):
+        """
+        Set the poster fields from the first (text, href) profile link that
+        looks like a job poster.
+        """
+        for text, href in links:
+            # Valid poster link should:
+            # 1. Have text (name)
+            # 2. Not be a random icon/image link
+            # 3. Contain "Job poster" or be in hiring team section
+            # Note: Text can be multi-line with name, title, "Job poster", etc.
+            if not href or not text or not 2 < len(text) < 200:
+                continue
+
+            # Check if this is a job poster link
+            lowered = text.lower()
+            if "job poster" not in lowered and "hiring team" not in lowered and "recruiter" not in lowered:
+                continue
+
+            self._set_poster(text, href)
+            return
+
+    def _set_poster(self, text, href):
+        """Set the poster fields from a profile link's href and (multi-line) text"""
+        query_start = href.find("?")
+        self.poster_profile_url = href if query_start < 0 else href[:query_start]
+
+        # Parse the multi-line text to extract name and headline
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+        # First line is usually the name
+        if lines:
+            # Remove "• 3rd" or similar connection indicators
+            name_line = lines[0].replace('•', '').replace('3rd', '').replace('2nd', '').replace('1st', '').strip()
+            self.poster_name = name_line
+
+        # Look for headline (usually contains "at" or job title keywords)
+        for line in lines:
+            if " at " in line.lower() or "recruiter" in line.lower() or "manager" in line.lower():
+                self.poster_headline = line.strip()
+                break
+
+        # Extract profile ID from URL
+        match = c.PROFILE_ID_RE.search(self.poster_profile_url)
+        if match:
+            self.poster_profile_id = match.group(1)
+
+        print(f"   ✓ Found poster: {self.poster_name} (ID: {self.poster_profile_id})")
+        if self.poster_headline:
+            print(f"   ✓ Found headline: {self.poster_headline}")
+
     def to_dict(self):
         """Convert to dictionary"""
         return {
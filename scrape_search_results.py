@@ -5,6 +5,8 @@ Scrape all jobs from a LinkedIn search results page with MULTI-PAGE PAGINATION
 Usage:
     source venv/bin/activate
     python3 scrape_search_results.py
+    python3 scrape_search_results.py --force-rescrape  # ignore cached jobs
+    python3 scrape_search_results.py --headless  # no browser window
 
 This will:
 1. Login to LinkedIn
@@ -12,24 +14,67 @@ This will:
 3. Loop through ALL pages (clicking "Next" button)
 4. Scroll and load all job cards on each page
 5. Extract all job URLs across all pages
-6. Scrape each job (with poster info)
-7. Save all results to JSON and CSV
+6. Scrape each job (with poster info), starting as soon as its page is read
+7. Save each result to JSONL and CSV as soon as it is scraped
 """
-from linkedin_scraper import SearchResultsScraper, JobScraperV2, actions
-from selenium import webdriver
+from concurrent.futures import ThreadPoolExecutor
 import json
 import csv
+import operator
 from datetime import datetime
+import queue
+import threading
 import time
 import os
-from dotenv import load_dotenv
+from connection_automation.cache import JsonCache
+from connection_automation import config
+
+try:
+    import orjson  # Optional: much faster serialization of job rows
+except ImportError:
+    orjson = None
+
+
+def to_json_line(job_data):
+    """Serialize one job as a UTF-8 JSON Lines record"""
+    if orjson:
+        return orjson.dumps(job_data) + b"\n"
+    # Compact separators so both paths write the same bytes
+    return (json.dumps(job_data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def open_logged_in_drivers(driver, count, headless=False):
+    """
+    Start `count` more Chrome drivers that share `driver`'s LinkedIn session.
+    Copies its cookies instead of logging in again from each browser.
+    """
+    from connection_automation.connection_sender import build_driver
+
+    cookies = driver.get_cookies()
+    drivers = []
+    for _ in range(count):
+        new_driver = build_driver(headless=headless, block_images=True)
+        # Cookies can only be set for the domain currently loaded
+        new_driver.get("https://www.linkedin.com/")
+        for cookie in cookies:
+            try:
+                new_driver.add_cookie(cookie)
+            except Exception:
+                pass
+        drivers.append(new_driver)
+    return drivers
 
-# Load environment variables from .env file
-load_dotenv()
 
+def scrape_all_jobs_from_search(force_rescrape=False, min_interval=1.5, headless=False):
+    """
+    Main function to scrape all jobs from search results
 
-def scrape_all_jobs_from_search():
-    """Main function to scrape all jobs from search results"""
+    Args:
+        force_rescrape: Scrape every job again, ignoring cached results
+        min_interval: Minimum seconds between requests to LinkedIn, shared
+            by all workers; only the part not already spent is slept
+        headless: Run Chrome without a window and close it without asking
+    """
 
     print("=" * 80)
     print("LinkedIn Search Results Scraper - Multi-Page with Poster Extraction")
@@ -93,7 +138,10 @@ def scrape_all_jobs_from_search():
         MAX_PAGES = None
         print(f"✓ Using default: ALL pages (until Next button disabled)")
 
-    # Configuration - Load from environment variables
+    # Configuration - Load from environment variables (.env file)
+    from dotenv import load_dotenv
+    load_dotenv()
+
     EMAIL = os.getenv("LINKEDIN_EMAIL")
     PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
@@ -108,6 +156,11 @@ def scrape_all_jobs_from_search():
         return
 
     SCROLL_PAUSE = 2  # Seconds to wait between scrolls
+    BROWSER_POOL_SIZE = 3  # Browsers scraping jobs at once (keep 3-5 to avoid rate limits)
+    HTTP_WORKERS = BROWSER_POOL_SIZE  # Jobs in progress at once (browsers only fill gaps)
+    SCRAPE_CACHE_MAX_AGE = 7 * 24 * 3600  # Reuse jobs scraped in the last 7 days
+    BACKOFF_REQUESTS = 5  # Requests to keep the doubled interval after a LinkedIn challenge
+    MAX_INTERVAL = 60  # Upper bound for the backed-off interval (seconds)
 
     print(f"\n📋 Configuration:")
     print(f"   Search URL: {SEARCH_URL}")
@@ -115,26 +168,49 @@ def scrape_all_jobs_from_search():
     print(f"   Max pages to scrape: {MAX_PAGES if MAX_PAGES else 'All pages until Next button disabled'}")
     print(f"   Email: {EMAIL}")
 
+    drivers = []  # Every browser started, so all of them get closed
+
     try:
         # Step 1: Setup browser and login
         print("\n" + "=" * 80)
         print("STEP 1: Browser Setup & Login")
         print("=" * 80)
 
+        # Selenium and the scraper package are only imported once the
+        # prompts are answered, so bad input exits without paying for them
+        from linkedin_scraper import SearchResultsScraper, JobScraperV2, actions
+        from linkedin_scraper.search_scraper_v2 import build_session
+        from connection_automation.connection_sender import build_driver
+
         print("🌐 Starting Chrome browser...")
-        driver = webdriver.Chrome()
+        # Images are never loaded; JobScraperV2 additionally blocks
+        # stylesheets and fonts on job pages (search pages keep them)
+        driver = build_driver(user_data_dir=config.CHROME_PROFILE_DIR, headless=headless, block_images=True)
+        drivers.append(driver)
 
         print("🔐 Logging into LinkedIn...")
-        actions.login(driver, EMAIL, PASSWORD)
-        print("✅ Login successful!")
-
-        time.sleep(2)
-
-        # Step 2: Extract job URLs from search results (WITH PAGINATION!)
+        # The saved Chrome profile usually still holds the session
+        if actions.login_if_needed(driver, EMAIL, PASSWORD):
+            print("✅ Login successful!")
+            time.sleep(2)
+        else:
+            print("✅ Already logged in (saved browser profile)")
+
+        # Steps 2 and 3 overlap: pagination runs on the login browser in a
+        # producer thread while the other browsers scrape the jobs it found
         print("\n" + "=" * 80)
-        print("STEP 2: Extract Job URLs from Search Results (Multi-Page)")
+        print("STEP 2+3: Extract Job URLs (Multi-Page) and Scrape Each Job")
         print("=" * 80)
 
+        # Pool of logged-in browsers; each worker checks one out per job.
+        # The login browser joins the pool once pagination is done.
+        print(f"🌐 Starting {BROWSER_POOL_SIZE - 1} more browser(s) for parallel scraping...")
+        drivers.extend(open_logged_in_drivers(driver, BROWSER_POOL_SIZE - 1, headless=headless))
+
+        driver_pool = queue.Queue()
+        for pooled_driver in drivers[1:]:
+            driver_pool.put(pooled_driver)
+
         search_scraper = SearchResultsScraper(
             search_url=SEARCH_URL,
             driver=driver,
@@ -143,90 +219,220 @@ def scrape_all_jobs_from_search():
             scroll_pause=SCROLL_PAUSE
         )
 
-        job_urls = search_scraper.get_all_job_urls()
-
-        if not job_urls:
-            print("\n❌ No job URLs found!")
-            driver.quit()
-            return
+        url_queue = queue.Queue(maxsize=50)
+        end_of_urls = object()
 
-        print(f"\n✅ Found {len(job_urls)} job URLs to scrape")
-        print("\nFirst 5 URLs:")
-        for i, url in enumerate(job_urls[:5], 1):
-            print(f"   {i}. {url}")
+        def produce_job_urls():
+            try:
+                for job_url in search_scraper.iter_job_urls():
+                    url_queue.put(job_url)
+            except Exception as e:
+                print(f"\n❌ Pagination stopped: {e}")
+            finally:
+                url_queue.put(end_of_urls)
+                driver_pool.put(driver)
 
-        # Step 3: Scrape each job
-        print("\n" + "=" * 80)
-        print(f"STEP 3: Scraping {len(job_urls)} Jobs")
-        print("=" * 80)
+        threading.Thread(target=produce_job_urls, daemon=True).start()
 
-        all_jobs = []
+        found = 0
         successful = 0
         failed = 0
+        cached_count = 0
+        poster_count = 0
+        poster_samples = []  # First few jobs with poster info, for the summary
+        progress = 0
+        # Serializes output, cache and counter updates across worker threads
+        results_lock = threading.Lock()
+
+        # Each job is written as soon as it is scraped, so a crash or
+        # Ctrl+C keeps everything scraped so far
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"linkedin_jobs_search_{timestamp}.jsonl"
+        csv_output_file = f"linkedin_jobs_search_{timestamp}.csv"
 
-        for i, job_url in enumerate(job_urls, 1):
-            print(f"\n[{i}/{len(job_urls)}] Scraping job...")
-
-            try:
+        # Define CSV columns (matches to_dict() field order)
+        fieldnames = [
+            "linkedin_url",
+            "job_title",
+            "company",
+            "company_linkedin_url",
+            "location",
+            "posted_date",
+            "applicant_count",
+            "job_description",
+            "benefits",
+            "poster_name",
+            "poster_headline",
+            "poster_profile_url",
+            "poster_profile_id"
+        ]
+
+        with open(output_file, "wb") as json_f, \
+                open(csv_output_file, "w", newline="", encoding="utf-8") as csv_f, \
+                JsonCache(config.CACHE_DB, table="scraped_jobs") as scrape_cache:
+            # Plain csv.writer with one C-level itemgetter per row instead
+            # of DictWriter's per-field dict lookups
+            writer = csv.writer(csv_f)
+            writer.writerow(fieldnames)
+            row_values = operator.itemgetter(*fieldnames)
+
+            def save_job(job_data, note=""):
+                """Write one job to both outputs; call with results_lock held"""
+                nonlocal successful, poster_count, progress
+                progress += 1
+                successful += 1
+                print(f"\n[{progress}/{found}] ✓ {job_data['job_title']} at {job_data['company']}{note}")
+
+                # One JSON object per line (JSON Lines)
+                json_f.write(to_json_line(job_data))
+                writer.writerow(row_values(job_data))
+                json_f.flush()
+                csv_f.flush()
+
+                if job_data.get('poster_profile_id'):
+                    poster_count += 1
+                    if len(poster_samples) < 3:
+                        poster_samples.append(job_data)
+
+            # Set on Ctrl+C: running jobs stop pacing and nothing more is written
+            stopping = threading.Event()
+
+            # Shared by every worker: LinkedIn sees one stream of requests, so
+            # each guest fetch or browser load waits for a run-wide slot
+            # min_interval after the previous one, and a challenge or rate
+            # limit on any worker slows them all
+            pacing = {"interval": min_interval, "backoff_left": 0, "next_at": 0.0}
+            pacing_lock = threading.Lock()
+
+            def wait_turn():
+                """Block until this worker may send its next request to LinkedIn"""
+                with pacing_lock:
+                    now = time.monotonic()
+                    turn = max(now, pacing["next_at"])
+                    pacing["next_at"] = turn + pacing["interval"]
+                stopping.wait(turn - now)
+
+            def record_outcome(challenged):
+                """Double the interval for BACKOFF_REQUESTS requests after a challenge or rate limit"""
+                with pacing_lock:
+                    if challenged:
+                        pacing["interval"] = min(pacing["interval"] * 2, MAX_INTERVAL)
+                        pacing["backoff_left"] = BACKOFF_REQUESTS
+                        # Slots already handed out used the old interval
+                        pacing["next_at"] = max(pacing["next_at"], time.monotonic() + pacing["interval"])
+                        print(f"   ⚠️  LinkedIn challenge or rate limit, slowing to {pacing['interval']:.1f}s per request")
+                    elif pacing["backoff_left"]:
+                        pacing["backoff_left"] -= 1
+                        if not pacing["backoff_left"]:
+                            pacing["interval"] = min_interval
+
+            # One pooled HTTP session for the guest job pages
+            session = build_session(pool_size=HTTP_WORKERS)
+
+            def scrape_one(job_url):
+                # Plain HTTP first; a browser is only checked out when the
+                # guest page is gated or hides the hiring team
+                wait_turn()
                 job_scraper = JobScraperV2(
                     linkedin_url=job_url,
-                    driver=driver,
-                    close_on_complete=False
+                    close_on_complete=False,
+                    session=session
                 )
+                # A 429/999 or empty guest page backs off before the browser
+                # asks LinkedIn for the same job again
+                record_outcome(job_scraper.throttled)
+                challenged = job_scraper.throttled
+
+                if job_scraper.needs_browser():
+                    pooled_driver = driver_pool.get()
+                    try:
+                        wait_turn()
+                        job_scraper.finish_with_browser(pooled_driver)
+                        current_url = pooled_driver.current_url
+                    finally:
+                        driver_pool.put(pooled_driver)
+                    challenged_in_browser = "captcha" in current_url or "checkpoint" in current_url
+                    record_outcome(challenged_in_browser)
+                    challenged = challenged or challenged_in_browser
 
                 job_data = job_scraper.to_dict()
-                all_jobs.append(job_data)
-                successful += 1
 
-                # Small delay to avoid rate limiting
-                time.sleep(1)
+                # Challenge pages and half-read jobs are saved but not cached,
+                # so the next run scrapes them again
+                cacheable = not challenged and bool(job_data["job_title"] and job_data["company"])
+                return job_data, cacheable
+
+            # Caps jobs submitted but not finished, so pagination blocks on
+            # url_queue instead of queueing the whole search in the executor
+            in_flight = threading.BoundedSemaphore(HTTP_WORKERS * 2)
+
+            def on_scraped(future, job_url):
+                nonlocal failed, progress
+                in_flight.release()
+                with results_lock:
+                    if stopping.is_set():
+                        return  # Interrupted: outputs and cache are being closed
+                    try:
+                        job_data, cacheable = future.result()
+                    except Exception as e:
+                        progress += 1
+                        print(f"\n[{progress}/{found}] ❌ Failed: {job_url}: {e}")
+                        failed += 1
+                        return
+
+                    if cacheable:
+                        scrape_cache.set(job_url, job_data)
+                    save_job(job_data)
+
+            # Not a with-block: its exit waits for every submitted job, so
+            # Ctrl+C would only take effect after all of them had run
+            executor = ThreadPoolExecutor(max_workers=HTTP_WORKERS)
+            try:
+                while True:
+                    job_url = url_queue.get()
+                    if job_url is end_of_urls:
+                        break
+
+                    with results_lock:
+                        found += 1
+                        # Jobs scraped by an earlier run within SCRAPE_CACHE_MAX_AGE are reused
+                        cached = None if force_rescrape else scrape_cache.get(job_url, max_age=SCRAPE_CACHE_MAX_AGE)
+                        if cached is not None:
+                            cached_count += 1
+                            save_job(cached, " (cached)")
+                            continue
+
+                    in_flight.acquire()
+                    future = executor.submit(scrape_one, job_url)
+                    future.add_done_callback(lambda f, job_url=job_url: on_scraped(f, job_url))
+            except KeyboardInterrupt:
+                with results_lock:
+                    stopping.set()
+                # Drop queued jobs without waiting for running ones; killing
+                # the browsers (below) makes their browser steps fail fast
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+
+        if not found:
+            print("\n❌ No job URLs found!")
+            os.remove(output_file)
+            os.remove(csv_output_file)
+            for pooled_driver in drivers:
+                pooled_driver.quit()
+            return
 
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
-                failed += 1
-                # Continue to next job
-                continue
+        if cached_count:
+            print(f"\n♻️  Reused {cached_count} cached job(s)")
 
         # Step 4: Save results
         print("\n" + "=" * 80)
         print("STEP 4: Saving Results")
         print("=" * 80)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"linkedin_jobs_search_{timestamp}.json"
-        csv_output_file = f"linkedin_jobs_search_{timestamp}.csv"
-
-        # Save as JSON
-        with open(output_file, "w") as f:
-            json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-
-        # Save as CSV
-        with open(csv_output_file, "w", newline="", encoding="utf-8") as f:
-            if all_jobs:
-                # Define CSV columns (matches to_dict() field order)
-                fieldnames = [
-                    "linkedin_url",
-                    "job_title",
-                    "company",
-                    "company_linkedin_url",
-                    "location",
-                    "posted_date",
-                    "applicant_count",
-                    "job_description",
-                    "benefits",
-                    "poster_name",
-                    "poster_headline",
-                    "poster_profile_url",
-                    "poster_profile_id"
-                ]
-
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(all_jobs)
-
         print(f"\n💾 Results saved to:")
-        print(f"   JSON: {output_file}")
-        print(f"   CSV:  {csv_output_file}")
+        print(f"   JSONL: {output_file}")
+        print(f"   CSV:   {csv_output_file}")
 
         # Step 5: Summary
         print("\n" + "=" * 80)
@@ -234,18 +440,17 @@ def scrape_all_jobs_from_search():
         print("=" * 80)
 
         print(f"\n📊 Statistics:")
-        print(f"   Total jobs found: {len(job_urls)}")
+        print(f"   Total jobs found: {found}")
         print(f"   Successfully scraped: {successful}")
         print(f"   Failed: {failed}")
-        print(f"   Success rate: {(successful/len(job_urls)*100):.1f}%")
+        print(f"   Success rate: {(successful/found*100):.1f}%")
 
         # Show jobs with poster info
-        jobs_with_poster = [j for j in all_jobs if j.get('poster_profile_id')]
-        print(f"\n👤 Jobs with poster info: {len(jobs_with_poster)}/{successful}")
+        print(f"\n👤 Jobs with poster info: {poster_count}/{successful}")
 
-        if jobs_with_poster:
+        if poster_samples:
             print("\n📋 Sample jobs with poster:")
-            for job in jobs_with_poster[:3]:
+            for job in poster_samples:
                 print(f"   • {job['job_title']} at {job['company']}")
                 print(f"     Posted by: {job['poster_name']} (ID: {job['poster_profile_id']})")
 
@@ -253,17 +458,19 @@ def scrape_all_jobs_from_search():
         print("✨ Scraping Complete!")
         print("=" * 80)
 
-        input("\n⏸️  Press Enter to close the browser...")
-        driver.quit()
+        if not headless:
+            input("\n⏸️  Press Enter to close the browser...")
+        for pooled_driver in drivers:
+            pooled_driver.quit()
 
-        return all_jobs
+        return successful
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user (Ctrl+C)")
-        try:
-            driver.quit()
-        except:
-            pass
+        # Kill instead of quit: don't make the user wait on Chrome's shutdown
+        from connection_automation.connection_sender import kill_driver
+        for pooled_driver in drivers:
+            kill_driver(pooled_driver)
         return None
 
     except Exception as e:
@@ -272,16 +479,46 @@ def scrape_all_jobs_from_search():
         traceback.print_exc()
 
         try:
-            input("\n⏸️  Press Enter to close the browser...")
-            driver.quit()
+            if not headless:
+                input("\n⏸️  Press Enter to close the browser...")
         except:
             pass
+        for pooled_driver in drivers:
+            try:
+                pooled_driver.quit()
+            except:
+                pass
 
         return None
 
 
 if __name__ == "__main__":
+    import argparse
     import sys
 
-    result = scrape_all_jobs_from_search()
+    parser = argparse.ArgumentParser(description="Scrape all jobs from a LinkedIn search results page")
+    parser.add_argument(
+        "--force-rescrape",
+        action="store_true",
+        help="Ignore cached results and scrape every job again"
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=1.5,
+        help="Minimum seconds between requests to LinkedIn across all workers (default: 1.5)"
+    )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run Chrome without a window (default: off)"
+    )
+    args = parser.parse_args()
+
+    result = scrape_all_jobs_from_search(
+        force_rescrape=args.force_rescrape,
+        min_interval=args.min_interval,
+        headless=args.headless
+    )
     sys.exit(0 if result else 1)
@@ -13,28 +13,30 @@ Usage:
     cd /Users/takshitmathur/Desktop/Projects/linkedin_scraper
     source venv/bin/activate
     python3 scripts/dry_run.py
+    python3 scripts/dry_run.py --headless  # no browser window
 """
 import sys
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from linkedin_scraper import actions
-from selenium import webdriver
 import time
+from itertools import islice
 
 from connection_automation.data_loader import load_and_prepare_data, get_profile_summary
-from connection_automation.connection_sender import ConnectionSender
-from connection_automation.utils import random_sleep
+from connection_automation.cache import JsonCache
+from connection_automation import config
+from connection_automation.utils import random_deadline, sleep_until
+
 
+def main(headless=False):
+    """
+    Main dry-run function
 
-def main():
-    """Main dry-run function"""
+    Args:
+        headless: Run Chrome without a window and close it without asking
+    """
 
     print("=" * 80)
     print("Connection Automation - DRY RUN (Test Mode)")
@@ -49,8 +51,8 @@ def main():
     print("Step 1: Input File")
     print("=" * 80)
     print()
-    print("Enter path to scraped jobs file (JSON or CSV)")
-    print(f"Example: data/input/linkedin_jobs_search_20251112_183212.json")
+    print("Enter path to scraped jobs file (JSONL, JSON or CSV)")
+    print(f"Example: data/input/linkedin_jobs_search_20251112_183212.jsonl")
     print()
 
     input_file = input("File path: ").strip()
@@ -93,7 +95,8 @@ def main():
     print()
 
     try:
-        profiles = load_and_prepare_data(input_file)
+        with JsonCache(config.CACHE_DB, table="prepared_data") as cache:
+            profiles = load_and_prepare_data(input_file, cache=cache)
     except Exception as e:
         print(f"❌ Error loading data: {e}")
         return
@@ -102,7 +105,7 @@ def main():
         print("❌ No profiles with poster URLs found in file")
         return
 
-    profiles_to_test = profiles[:test_count]
+    profiles_to_test = list(islice(profiles.values(), test_count))
     print(f"\n✓ Selected {len(profiles_to_test)} profiles for testing")
 
     # Step 4: Login to LinkedIn
@@ -112,7 +115,14 @@ def main():
     print("=" * 80)
     print()
 
-    # Load credentials from environment variables
+    # Selenium, the scraper package and .env are only loaded once the
+    # prompts are answered, so bad input exits without paying for them
+    from dotenv import load_dotenv
+    from linkedin_scraper import actions
+    from connection_automation.connection_sender import ConnectionSender, FastDriver, build_driver
+
+    # Load credentials from environment variables (.env file)
+    load_dotenv()
     EMAIL = os.getenv("LINKEDIN_EMAIL")
     PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
@@ -124,100 +134,124 @@ def main():
         return
 
     print("🌐 Starting Chrome browser...")
-    driver = webdriver.Chrome()
+    # Killed rather than quit if the run is interrupted (Ctrl+C)
+    with FastDriver(build_driver(user_data_dir=config.CHROME_PROFILE_DIR, headless=headless)) as driver:
+        print("🔐 Logging into LinkedIn...")
+        try:
+            # The saved Chrome profile usually still holds the session
+            if actions.login_if_needed(driver, EMAIL, PASSWORD):
+                print("✅ Login successful!")
+                time.sleep(2)
+            else:
+                print("✅ Already logged in (saved browser profile)")
+        except Exception as e:
+            print(f"❌ Login failed: {e}")
+            return
 
-    print("🔐 Logging into LinkedIn...")
-    try:
-        actions.login(driver, EMAIL, PASSWORD)
-        print("✅ Login successful!")
-        time.sleep(2)
-    except Exception as e:
-        print(f"❌ Login failed: {e}")
-        driver.quit()
-        return
+        # Step 5: Test profiles
+        print()
+        print("=" * 80)
+        print("Step 5: Testing Profiles (DRY RUN - No Clicking)")
+        print("=" * 80)
+        print()
 
-    # Step 5: Test profiles
-    print()
-    print("=" * 80)
-    print("Step 5: Testing Profiles (DRY RUN - No Clicking)")
-    print("=" * 80)
-    print()
+        connection_sender = ConnectionSender(driver)
+
+        results = {
+            'connect_found': 0,
+            'already_connected': 0,
+            'connect_not_found': 0,
+            'navigation_failed': 0
+        }
+
+        # Deadline set by the previous profile; navigation time counts toward it
+        next_action_at = 0.0
+
+        # Profile states are kept so the production run can skip known ones
+        with JsonCache(config.CACHE_DB, table="dry_run_results") as dry_run_cache:
+            for i, profile in enumerate(profiles_to_test, 1):
+                profile_id = profile.get('poster_profile_id')
+                profile_url = profile.get('poster_profile_url')
+                summary = get_profile_summary(profile)
+
+                print(f"[{i}/{len(profiles_to_test)}] {summary}")
+                print(f"   URL: {profile_url}")
+
+                sleep_until(next_action_at)
+                next_action_at = random_deadline(2, 3)
+
+                # Navigate to profile
+                print(f"   📍 Navigating...")
+                if not connection_sender.navigate_to_profile(profile_url):
+                    print(f"   ❌ Navigation failed")
+                    results['navigation_failed'] += 1
+                    dry_run_cache.set(profile_id, {'state': 'navigation_failed'})
+                    continue
+
+                # Check if already connected
+                if connection_sender.is_already_connected():
+                    print(f"   ⚠️  Already connected or pending")
+                    state = 'already_connected'
+                else:
+                    # Try to find Connect button (but don't click!)
+                    connect_button = connection_sender.find_connect_button()
+
+                    if connect_button:
+                        print(f"   ✅ Connect button found (would send request)")
+                        state = 'connect_found'
+                    else:
+                        print(f"   ❌ Connect button not found")
+                        state = 'connect_not_found'
+
+                results[state] += 1
+                dry_run_cache.set(profile_id, {'state': state})
+
+                print()
+
+        # Step 6: Summary
+        print("=" * 80)
+        print("Dry Run Summary")
+        print("=" * 80)
+        print()
+        print(f"📊 Results:")
+        print(f"   Tested: {len(profiles_to_test)}")
+        print(f"   Connect button found: {results['connect_found']}")
+        print(f"   Already connected: {results['already_connected']}")
+        print(f"   Connect button not found: {results['connect_not_found']}")
+        print(f"   Navigation failed: {results['navigation_failed']}")
+        print()
 
-    connection_sender = ConnectionSender(driver)
-
-    results = {
-        'connect_found': 0,
-        'already_connected': 0,
-        'connect_not_found': 0,
-        'navigation_failed': 0
-    }
-
-    for i, profile in enumerate(profiles_to_test, 1):
-        profile_url = profile.get('poster_profile_url')
-        summary = get_profile_summary(profile)
-
-        print(f"[{i}/{len(profiles_to_test)}] {summary}")
-        print(f"   URL: {profile_url}")
-
-        # Navigate to profile
-        print(f"   📍 Navigating...")
-        if not connection_sender.navigate_to_profile(profile_url):
-            print(f"   ❌ Navigation failed")
-            results['navigation_failed'] += 1
-            continue
-
-        # Check if already connected
-        if connection_sender.is_already_connected():
-            print(f"   ⚠️  Already connected or pending")
-            results['already_connected'] += 1
+        if results['connect_found'] > 0:
+            success_rate = (results['connect_found'] / len(profiles_to_test)) * 100
+            print(f"✓ Success rate: {success_rate:.1f}%")
+            print(f"✓ Ready to run production script with {results['connect_found']} profiles")
         else:
-            # Try to find Connect button (but don't click!)
-            connect_button = connection_sender.find_connect_button()
+            print(f"⚠️  No Connect buttons found - check profile URLs or LinkedIn account status")
 
-            if connect_button:
-                print(f"   ✅ Connect button found (would send request)")
-                results['connect_found'] += 1
-            else:
-                print(f"   ❌ Connect button not found")
-                results['connect_not_found'] += 1
-
-        # Small delay between profiles
-        random_sleep(2, 3)
+        print()
+        print("=" * 80)
+        print("✨ Dry Run Complete - No requests were sent")
+        print("=" * 80)
         print()
 
-    # Step 6: Summary
-    print("=" * 80)
-    print("Dry Run Summary")
-    print("=" * 80)
-    print()
-    print(f"📊 Results:")
-    print(f"   Tested: {len(profiles_to_test)}")
-    print(f"   Connect button found: {results['connect_found']}")
-    print(f"   Already connected: {results['already_connected']}")
-    print(f"   Connect button not found: {results['connect_not_found']}")
-    print(f"   Navigation failed: {results['navigation_failed']}")
-    print()
+        if not headless:
+            input("Press Enter to close browser...")
 
-    if results['connect_found'] > 0:
-        success_rate = (results['connect_found'] / len(profiles_to_test)) * 100
-        print(f"✓ Success rate: {success_rate:.1f}%")
-        print(f"✓ Ready to run production script with {results['connect_found']} profiles")
-    else:
-        print(f"⚠️  No Connect buttons found - check profile URLs or LinkedIn account status")
 
-    print()
-    print("=" * 80)
-    print("✨ Dry Run Complete - No requests were sent")
-    print("=" * 80)
-    print()
-
-    input("Press Enter to close browser...")
-    driver.quit()
+if __name__ == "__main__":
+    import argparse
 
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run Chrome without a window (default: off)"
+    )
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     try:
-        main()
+        main(headless=args.headless)
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user (Ctrl+C)")
         sys.exit(1)
@@ -10,32 +10,32 @@ Usage:
     cd /Users/takshitmathur/Desktop/Projects/linkedin_scraper
     source venv/bin/activate
     python3 scripts/run_connection_sender.py
+    python3 scripts/run_connection_sender.py --no-headless  # show the browser window
 """
 import sys
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from linkedin_scraper import actions
-from selenium import webdriver
 from datetime import datetime
 import time
 
 from connection_automation.data_loader import load_and_prepare_data, get_profile_summary
+from connection_automation.cache import JsonCache
 from connection_automation.tracker import ConnectionTracker
 from connection_automation.safety_manager import SafetyManager
-from connection_automation.connection_sender import ConnectionSender
 from connection_automation import config
-from connection_automation.utils import random_sleep, format_duration
+from connection_automation.utils import random_deadline, sleep_until, format_duration, format_timestamp, append_log_event
+
 
+def main(headless=True):
+    """
+    Main function to send connection requests
 
-def main():
-    """Main function to send connection requests"""
+    Args:
+        headless: Run Chrome without a window and close it without asking
+    """
 
     print("=" * 80)
     print("LinkedIn Connection Request Sender")
@@ -51,8 +51,8 @@ def main():
     print("Step 1: Input File")
     print("=" * 80)
     print()
-    print("Enter path to scraped jobs file (JSON or CSV)")
-    print(f"Example: data/input/linkedin_jobs_search_20251112_183212.json")
+    print("Enter path to scraped jobs file (JSONL, JSON or CSV)")
+    print(f"Example: data/input/linkedin_jobs_search_20251112_183212.jsonl")
     print()
 
     input_file = input("File path: ").strip()
@@ -96,7 +96,8 @@ def main():
     print()
 
     try:
-        profiles = load_and_prepare_data(input_file)
+        with JsonCache(config.CACHE_DB, table="prepared_data") as cache:
+            profiles = load_and_prepare_data(input_file, cache=cache)
     except Exception as e:
         print(f"❌ Error loading data: {e}")
         return
@@ -124,12 +125,12 @@ def main():
         print(f"\n💡 Suggestion: {safety_manager.suggest_next_run_time()}")
         return
 
-    # Filter out already contacted profiles
-    profiles_to_contact = []
-    for profile in profiles:
-        profile_id = profile.get('poster_profile_id')
-        if profile_id and not tracker.already_contacted(profile_id):
-            profiles_to_contact.append(profile)
+    # Filter out already contacted profiles (every prepared profile has an ID)
+    contacted_ids = tracker.load_contacted_ids()
+    profiles_to_contact = [
+        profile for profile_id, profile in profiles.items()
+        if profile_id not in contacted_ids
+    ]
 
     print(f"\n✓ Found {len(profiles_to_contact)} profiles to contact")
     print(f"  (Skipped {len(profiles) - len(profiles_to_contact)} already contacted)")
@@ -145,7 +146,14 @@ def main():
     print("=" * 80)
     print()
 
-    # Load credentials from environment variables
+    # Selenium, the scraper package and .env are only loaded once the
+    # prompts are answered, so bad input exits without paying for them
+    from dotenv import load_dotenv
+    from linkedin_scraper import actions
+    from connection_automation.connection_sender import ConnectionSender, FastDriver, build_driver
+
+    # Load credentials from environment variables (.env file)
+    load_dotenv()
     EMAIL = os.getenv("LINKEDIN_EMAIL")
     PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
@@ -157,140 +165,195 @@ def main():
         return
 
     print("🌐 Starting Chrome browser...")
-    driver = webdriver.Chrome()
-
-    print("🔐 Logging into LinkedIn...")
-    try:
-        actions.login(driver, EMAIL, PASSWORD)
-        print("✅ Login successful!")
-        time.sleep(2)
-    except Exception as e:
-        print(f"❌ Login failed: {e}")
-        driver.quit()
-        return
-
-    # Step 6: Send connection requests
-    print()
-    print("=" * 80)
-    print("Step 6: Sending Connection Requests")
-    print("=" * 80)
-    print()
-
-    connection_sender = ConnectionSender(driver)
-
-    sent_count = 0
-    already_connected_count = 0
-    failed_count = 0
-
-    start_time = datetime.now()
-
-    # Calculate how many we can send today
-    quota_status = safety_manager.get_quota_status()
-    max_to_send = min(len(profiles_to_contact), quota_status['daily_remaining'])
-
-    print(f"Will attempt to send {max_to_send} connection requests")
-    print(f"(Daily quota: {quota_status['daily_remaining']} remaining)")
-    print()
-
-    for i, profile in enumerate(profiles_to_contact[:max_to_send], 1):
-        profile_id = profile.get('poster_profile_id')
-        profile_url = profile.get('poster_profile_url')
-        poster_name = profile.get('poster_name', 'Unknown')
-        job_title = profile.get('job_title', 'Unknown')
-        company = profile.get('company', 'Unknown')
-
-        summary = get_profile_summary(profile)
-
-        print(f"[{i}/{max_to_send}] {summary}")
-
-        # Check quota before each request
-        can_send, reason = safety_manager.can_send_request()
-        if not can_send:
-            print(f"   ⚠️  {reason}")
-            break
-
-        # Navigate to profile
-        print(f"   📍 Navigating to profile...")
-        if not connection_sender.navigate_to_profile(profile_url):
-            print(f"   ❌ Failed to navigate")
-            tracker.mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, "Navigation failed")
-            failed_count += 1
-            continue
-
-        # Check if already connected
-        if connection_sender.is_already_connected():
-            print(f"   ⚠️  Already connected or pending")
-            tracker.mark_as_sent(profile_id, profile_url, 'already_connected', poster_name, job_title, company)
-            already_connected_count += 1
-            random_sleep(config.MIN_DELAY_BETWEEN_ACTIONS, config.MAX_DELAY_BETWEEN_ACTIONS)
-            continue
-
-        # Send connection request
-        print(f"   🤝 Sending connection request...")
-        success, message = connection_sender.send_connection_with_verification()
-
-        if success:
-            print(f"   ✅ {message}")
-            tracker.mark_as_sent(profile_id, profile_url, 'success', poster_name, job_title, company)
-            sent_count += 1
-
-            # Delay between requests
-            delay = random_sleep(config.MIN_DELAY_BETWEEN_REQUESTS, config.MAX_DELAY_BETWEEN_REQUESTS)
-            print(f"   ⏸️  Waiting...")
-
-            # Take a break every N requests
-            if sent_count % config.PAUSE_EVERY_N == 0 and i < max_to_send:
-                break_duration = random_sleep(config.BREAK_DURATION_MIN, config.BREAK_DURATION_MAX)
-                print(f"\n   ☕ Taking a break...")
-        else:
-            print(f"   ❌ {message}")
-            tracker.mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, message)
-            failed_count += 1
-            random_sleep(config.MIN_DELAY_BETWEEN_ACTIONS, config.MAX_DELAY_BETWEEN_ACTIONS)
-
-    # Step 7: Summary and Export
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
-
-    print()
-    print("=" * 80)
-    print("Summary")
-    print("=" * 80)
-    print()
-    print(f"📊 Results:")
-    print(f"   Attempted: {sent_count + already_connected_count + failed_count}")
-    print(f"   Successfully sent: {sent_count}")
-    print(f"   Already connected: {already_connected_count}")
-    print(f"   Failed: {failed_count}")
-    print()
-    print(f"⏱️  Duration: {format_duration(duration)}")
-    print()
-
-    # Print updated quota status
-    safety_manager.print_quota_status()
-
-    # Export to CSV
-    print()
-    print("=" * 80)
-    print("Exporting Results")
-    print("=" * 80)
-    print()
-
-    tracker.export_to_csv(config.CSV_OUTPUT)
+    # Killed rather than quit if the run is interrupted (Ctrl+C)
+    with FastDriver(build_driver(user_data_dir=config.CHROME_PROFILE_DIR, headless=headless)) as driver:
+        print("🔐 Logging into LinkedIn...")
+        try:
+            # The saved Chrome profile usually still holds the session
+            if actions.login_if_needed(driver, EMAIL, PASSWORD):
+                print("✅ Login successful!")
+                time.sleep(2)
+            else:
+                print("✅ Already logged in (saved browser profile)")
+        except Exception as e:
+            print(f"❌ Login failed: {e}")
+            return
+
+        # Step 6: Send connection requests
+        print()
+        print("=" * 80)
+        print("Step 6: Sending Connection Requests")
+        print("=" * 80)
+        print()
+
+        connection_sender = ConnectionSender(driver)
+
+        def log_result(profile_id, status, message=None):
+            # One NDJSON line per attempt; never rewrites earlier events
+            append_log_event(config.LOG_FILE, {
+                'timestamp': format_timestamp(),
+                'profile_id': profile_id,
+                'status': status,
+                'message': message,
+            })
+
+        sent_count = 0
+        already_connected_count = 0
+        failed_count = 0
+
+        start_time = datetime.now()
+
+        # Calculate how many we can send today
+        quota_status = safety_manager.get_quota_status()
+        max_to_send = min(len(profiles_to_contact), quota_status['daily_remaining'])
+
+        print(f"Will attempt to send {max_to_send} connection requests")
+        print(f"(Daily quota: {quota_status['daily_remaining']} remaining)")
+        print()
+
+        # Settings and bound methods used on every iteration, resolved once
+        min_action_delay, max_action_delay = config.MIN_DELAY_BETWEEN_ACTIONS, config.MAX_DELAY_BETWEEN_ACTIONS
+        min_request_delay, max_request_delay = config.MIN_DELAY_BETWEEN_REQUESTS, config.MAX_DELAY_BETWEEN_REQUESTS
+        break_min, break_max = config.BREAK_DURATION_MIN, config.BREAK_DURATION_MAX
+        pause_every_n = config.PAUSE_EVERY_N
+        dry_run_max_age = config.DRY_RUN_RESULT_MAX_AGE
+        navigate_to_profile = connection_sender.navigate_to_profile
+        is_already_connected = connection_sender.is_already_connected
+        send_connection = connection_sender.send_connection_with_verification
+        mark_as_sent = tracker.mark_as_sent
+
+        # Pacing is a deadline set by the previous profile, measured from when
+        # its navigation started, so page loads count toward the delay
+        next_action_at = 0.0
+
+        # Profile states recorded by a recent scripts/dry_run.py
+        with JsonCache(config.CACHE_DB, table="dry_run_results") as dry_run_cache:
+            for i, profile in enumerate(profiles_to_contact[:max_to_send], 1):
+                profile_id = profile.get('poster_profile_id')
+                profile_url = profile.get('poster_profile_url')
+                poster_name = profile.get('poster_name', 'Unknown')
+                job_title = profile.get('job_title', 'Unknown')
+                company = profile.get('company', 'Unknown')
+
+                summary = get_profile_summary(profile)
+
+                print(f"[{i}/{max_to_send}] {summary}")
+
+                # Check quota before each request
+                can_send, reason = safety_manager.can_send_request()
+                if not can_send:
+                    print(f"   ⚠️  {reason}")
+                    break
+
+                # A recent dry run already saw this profile as connected/pending
+                dry_run_result = dry_run_cache.get(profile_id, max_age=dry_run_max_age)
+                if dry_run_result and dry_run_result['state'] == 'already_connected':
+                    print(f"   ⚠️  Already connected or pending (from dry run)")
+                    mark_as_sent(profile_id, profile_url, 'already_connected', poster_name, job_title, company)
+                    log_result(profile_id, 'already_connected', "From dry run")
+                    already_connected_count += 1
+                    continue
+
+                sleep_until(next_action_at)
+                paced_from = time.monotonic()
+
+                # Navigate to profile
+                print(f"   📍 Navigating to profile...")
+                if not navigate_to_profile(profile_url):
+                    print(f"   ❌ Failed to navigate")
+                    mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, "Navigation failed")
+                    log_result(profile_id, 'failed', "Navigation failed")
+                    failed_count += 1
+                    continue
+
+                # Check if already connected
+                if is_already_connected():
+                    print(f"   ⚠️  Already connected or pending")
+                    mark_as_sent(profile_id, profile_url, 'already_connected', poster_name, job_title, company)
+                    log_result(profile_id, 'already_connected')
+                    already_connected_count += 1
+                    next_action_at = random_deadline(min_action_delay, max_action_delay, paced_from)
+                    continue
+
+                # Send connection request
+                print(f"   🤝 Sending connection request...")
+                success, message = send_connection()
+
+                if success:
+                    print(f"   ✅ {message}")
+                    mark_as_sent(profile_id, profile_url, 'success', poster_name, job_title, company)
+                    log_result(profile_id, 'success', message)
+                    sent_count += 1
+
+                    # Delay between requests
+                    next_action_at = random_deadline(min_request_delay, max_request_delay, paced_from)
+                    print(f"   ⏸️  Waiting...")
+
+                    # Take a break every N requests
+                    if sent_count % pause_every_n == 0 and i < max_to_send:
+                        next_action_at = random_deadline(break_min, break_max, next_action_at)
+                        print(f"\n   ☕ Taking a break...")
+                else:
+                    print(f"   ❌ {message}")
+                    mark_as_sent(profile_id, profile_url, 'failed', poster_name, job_title, company, message)
+                    log_result(profile_id, 'failed', message)
+                    failed_count += 1
+                    next_action_at = random_deadline(min_action_delay, max_action_delay, paced_from)
+
+        # Step 7: Summary and Export
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+
+        print()
+        print("=" * 80)
+        print("Summary")
+        print("=" * 80)
+        print()
+        print(f"📊 Results:")
+        print(f"   Attempted: {sent_count + already_connected_count + failed_count}")
+        print(f"   Successfully sent: {sent_count}")
+        print(f"   Already connected: {already_connected_count}")
+        print(f"   Failed: {failed_count}")
+        print()
+        print(f"⏱️  Duration: {format_duration(duration)}")
+        print()
+
+        # Print updated quota status
+        safety_manager.print_quota_status()
+
+        # Export to CSV
+        print()
+        print("=" * 80)
+        print("Exporting Results")
+        print("=" * 80)
+        print()
+
+        tracker.export_to_csv(config.CSV_OUTPUT)
+
+        print()
+        print("=" * 80)
+        print("✨ Complete!")
+        print("=" * 80)
+        print()
+
+        if not headless:
+            input("Press Enter to close browser...")
 
-    print()
-    print("=" * 80)
-    print("✨ Complete!")
-    print("=" * 80)
-    print()
 
-    input("Press Enter to close browser...")
-    driver.quit()
+if __name__ == "__main__":
+    import argparse
 
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run Chrome without a window (default: on)"
+    )
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     try:
-        main()
+        main(headless=args.headless)
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user (Ctrl+C)")
         sys.exit(1)